@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Show Chart rendering time growing linearly with the number of rows.
+
+Also compares redrawing a small dashboard table with Chart() against a
+layout compiled once with Chart.compile.
+"""
+import io
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.chart import Chart  # noqa: E402
+
+HEADERS = ["id", "name", "score", "status"]
+
+
+def rows(count: int) -> list:
+    return [[i, f"record-{i}", i * 0.5, "ok" if i % 3 else "failed"] for i in range(count)]
+
+
+def legacy(table: list) -> str:
+    """Reference of the previous row loop, which copied the chart every row."""
+    chart = ""
+    template = " │ ".join("{{{0}:^12}}".format(i) for i in range(len(HEADERS)))
+    for sublist in table:
+        chart = "{chart}{row}\n".format(chart=chart, row=template.format(*sublist))
+    return chart
+
+
+def timed(func, *args) -> float:
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def main() -> None:
+    for count in (10000, 50000, 100000, 200000):
+        table = rows(count)
+        streamed = timed(Chart.render_to, io.StringIO(), HEADERS, table)
+        joined = timed(Chart, HEADERS, table)
+        line = f"{count:>7} rows  render_to {streamed:.3f}s ({streamed / count * 1e6:.2f}us/row)"
+        columns = dict(zip(HEADERS, map(list, zip(*table))))
+        line += f"  Chart() {joined:.3f}s  columnar {timed(Chart, HEADERS, columns):.3f}s"
+        if count <= 10000:
+            line += f"  legacy {timed(legacy, table):.3f}s"
+        print(line)
+
+    # Redraw a Dashboard Sized Table Every Tick
+    table = rows(20)
+    compiled = Chart.compile(HEADERS, [8, 12, 8, 8])
+    ticks = 10000
+    adhoc = timed(lambda: [Chart(HEADERS, table) for _ in range(ticks)])
+    cached = timed(lambda: [compiled.render(table) for _ in range(ticks)])
+    print(f"{ticks} redraws of 20 rows  Chart() {adhoc:.3f}s  compiled {cached:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Compare reprinting a status table with diff based LiveChart refreshes."""
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.chart import Chart  # noqa: E402
+
+HEADERS = ["worker", "state", "processed", "errors"]
+
+
+class Counter:
+    """Terminal sink that only counts the characters written."""
+    def __init__(self):
+        self.chars = 0
+
+    def write(self, text: str) -> int:
+        self.chars += len(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def ticks(count: int, workers: int = 100, changes: int = 3):
+    """Yield the rows updated on every refresh."""
+    rand = random.Random(0)
+    for _ in range(count):
+        yield [
+            (i, [f"worker-{i}", rand.choice(["idle", "busy"]), rand.randrange(10 ** 6), 0])
+            for i in rand.sample(range(workers), changes)
+        ]
+
+
+def main(count: int = 5000, workers: int = 100) -> None:
+    initial = [[f"worker-{i}", "idle", 0, 0] for i in range(workers)]
+
+    # Rebuild and Reprint the Full Table
+    rows, sink = [list(row) for row in initial], Counter()
+    start = perf_counter()
+    for changes in ticks(count, workers):
+        for index, row in changes:
+            rows[index] = row
+        sink.write(Chart(HEADERS, rows) + "\n")
+    print(f"full reprint  {perf_counter() - start:.3f}s  {sink.chars / count:,.0f} chars/refresh")
+
+    # Refresh Only the Changed Lines
+    live, sink = Chart.live(HEADERS, initial), Counter()
+    start = perf_counter()
+    for changes in ticks(count, workers):
+        for index, row in changes:
+            live[index] = row
+        live.refresh(sink)
+    print(f"live refresh  {perf_counter() - start:.3f}s  {sink.chars / count:,.0f} chars/refresh")
+
+
+if __name__ == "__main__":
+    main()
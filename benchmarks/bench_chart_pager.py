@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Compare rendering a whole table with paging through it.
+
+The first page of a new pager pays for the width scan over every row,
+later pages reuse the cached widths.
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.chart import Chart  # noqa: E402
+
+HEADERS = ["id", "name", "score", "status"]
+
+
+def measure(func) -> tuple:
+    start = perf_counter()
+    func()
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(count: int = 1000000) -> None:
+    table = [[i, f"record-{i}", i * 0.5, "ok" if i % 3 else "failed"] for i in range(count)]
+    pager = Chart.pager(HEADERS, table, page_size=40)
+
+    pager.page(0)
+    for name, func in (
+        ("full render", lambda: Chart(HEADERS, table)),
+        ("first page", lambda: Chart.pager(HEADERS, table, page_size=40).page(0)),
+        ("cached page", lambda: pager.page(1)),
+        ("last page", lambda: pager.page(-1)),
+    ):
+        elapsed, peak = measure(func)
+        print(f"{name:<12} {elapsed:.4f}s  peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Compare memory per record of namespace types with tracemalloc."""
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.recursive_namespace import (  # noqa: E402
+    FrozenNamespace,
+    RecursiveNamespace,
+)
+from modules.refactor.recurser import Recurser  # noqa: E402
+
+
+def records(count: int = 200000) -> list:
+    """Build small homogeneous records."""
+    return [
+        {"id": i, "split": i % 4, "square_feet": i * 2, "active": True}
+        for i in range(count)
+    ]
+
+
+def measure(func, data: list) -> int:
+    """Return bytes allocated by func(data) that are still alive."""
+    tracemalloc.start()
+    result = func(data)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    data = records()
+    for name, func in (
+        ("dict", lambda x: [dict(r) for r in x]),
+        ("RecursiveNamespace", lambda x: [RecursiveNamespace(**r) for r in x]),
+        ("Recurser.rnamespace", lambda x: Recurser.rnamespace(x, nested_namespaces=True)),
+        ("FrozenNamespace", lambda x: [FrozenNamespace.from_dict(r) for r in x]),
+        ("rnamespace frozen", lambda x: Recurser.rnamespace(
+            x, nested_namespaces=True, namespace=FrozenNamespace.from_dict,
+        )),
+    ):
+        size = measure(func, data)
+        print(f"{name:<20} {size / len(data):7.1f} bytes/record")
+
+
+if __name__ == "__main__":
+    main()
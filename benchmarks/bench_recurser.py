@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark Recurser conversions on wide and deeply nested payloads."""
+import sys
+from functools import partial
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.recurser import Recurser  # noqa: E402
+
+
+def legacy_rdict(val, _counter=0):
+    """Recursive reference matching the pre stack-engine rdict."""
+    rcall = partial(legacy_rdict, _counter=(_counter+1))
+    if isinstance(val, Recurser.binary_types):
+        return str(val, Recurser.encoding)
+    elif isinstance(val, Recurser.mapping_types):
+        return {k: rcall(v) for k, v in val.items()}
+    elif isinstance(val, Recurser.iterable_types):
+        return [rcall(x) for x in val]
+    elif isinstance(val, Recurser.constant_types):
+        return val
+    return str(val)
+
+
+def wide_payload(records: int = 10000) -> list:
+    """Build a list of small API style records."""
+    return [
+        {
+            "id": i,
+            "name": f"record-{i}",
+            "blob": b"payload",
+            "tags": ("a", "b", "c"),
+            "meta": {"score": i * 0.5, "active": bool(i % 2), "refs": [i, i+1]},
+        }
+        for i in range(records)
+    ]
+
+
+def deep_payload(depth: int = 5000) -> dict:
+    """Build a single chain of nested mappings."""
+    payload = {"leaf": 1}
+    for i in range(depth):
+        payload = {"level": i, "child": [payload]}
+    return payload
+
+
+def shared_payload(depth: int = 16) -> dict:
+    """Build a chain where each level references the previous level twice."""
+    payload = {"leaf": 1}
+    for i in range(depth):
+        payload = {"level": i, "left": payload, "right": payload}
+    return payload
+
+
+class Record:
+    """Plain ORM style object with a handful of fields."""
+    table = "records"
+
+    def __init__(self, i: int) -> None:
+        self.id = i
+        self.name = f"record-{i}"
+        self.score = i * 0.5
+        self.active = bool(i % 2)
+
+    @property
+    def label(self) -> str:
+        return self.name.upper()
+
+    def save(self) -> None:
+        pass
+
+
+def legacy_attributes(val):
+    """dir() based reference matching the pre plan cache attribute reads."""
+    return {
+        x: getattr(val, x)
+        for x in dir(val)
+        if not x.startswith("_") and not callable(getattr(val, x))
+    }
+
+
+def best(func, number: int = 5) -> float:
+    return min(repeat(func, number=1, repeat=number))
+
+
+def main() -> None:
+    wide = wide_payload()
+    legacy = best(lambda: legacy_rdict(wide))
+    current = best(lambda: Recurser.rdict(wide))
+    print(f"wide  rdict   legacy {legacy:.4f}s  stack {current:.4f}s  "
+          f"speedup {legacy / current:.2f}x")
+
+    deep = deep_payload()
+    try:
+        legacy_rdict(deep)
+        legacy = "ok"
+    except RecursionError:
+        legacy = "RecursionError"
+    current = best(lambda: Recurser.rdict(deep))
+    print(f"deep  rdict   legacy {legacy}  stack {current:.4f}s")
+
+    current = best(lambda: Recurser.rnamespace(deep, nested_namespaces=True))
+    print(f"deep  rnamespace  stack {current:.4f}s")
+
+    shared = shared_payload()
+    copied = best(lambda: Recurser.rdict(shared), number=3)
+    reused = best(lambda: Recurser.rdict(shared, share=True), number=3)
+    print(f"shared rdict  copies {copied:.4f}s  share=True {reused:.6f}s")
+
+    objects = [Record(i) for i in range(100000)]
+    legacy = best(lambda: [legacy_attributes(x) for x in objects], number=3)
+    current = best(lambda: Recurser.rdict(objects, convert_nonbuiltins=True), number=3)
+    print(f"100k objects  legacy dir() {legacy:.4f}s  planned {current:.4f}s  "
+          f"speedup {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare peak memory of streaming and materialized rsnaked conversions.
+
+Also times parsing a single string value spanning many read chunks.
+"""
+import io
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.recurser import Recurser, events  # noqa: E402
+
+
+def document(records: int = 50000) -> str:
+    """Build a JSON export of camel cased records."""
+    return json.dumps([
+        {"recordId": i, "displayName": f"record-{i}", "isActive": bool(i % 2),
+         "nestedValues": {"scoreValue": i * 0.5, "refIds": [i, i + 1]}}
+        for i in range(records)
+    ])
+
+
+class Discard:
+    """Text sink so output size does not count towards peak memory."""
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def measure(func) -> tuple:
+    start = perf_counter()
+    func(io.StringIO(TEXT))
+    elapsed = perf_counter() - start
+
+    source = io.StringIO(TEXT)
+    tracemalloc.start()
+    func(source)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+TEXT = document()
+
+
+def main() -> None:
+    def materialized(source):
+        json.dump(Recurser.rsnaked(json.load(source)), Discard())
+
+    def streamed(source):
+        stream = events.json_events(source)
+        events.dump_json(Recurser.stream_rsnaked(stream), Discard())
+
+    for name, func in (("materialized", materialized), ("streamed", streamed)):
+        elapsed, peak = measure(func)
+        print(f"{name:<13} {elapsed:.3f}s  peak {peak / 2 ** 20:.1f} MiB")
+
+    for size in (4, 8, 16):
+        text = json.dumps(["x" * (size * 2 ** 20)])
+        start = perf_counter()
+        json.loads(text)
+        loaded = perf_counter() - start
+        start = perf_counter()
+        for _ in events.json_events(io.StringIO(text)):
+            pass
+        streamed = perf_counter() - start
+        print(f"{size:>2} MiB string  json.loads {loaded:.3f}s  "
+              f"json_events {streamed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
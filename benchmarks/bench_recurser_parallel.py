@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Benchmark parallel chunked Recurser conversions across worker counts."""
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.recurser import Recurser  # noqa: E402
+
+
+def records(count: int = 400000) -> list:
+    """Build API style records with camel cased keys."""
+    return [
+        {
+            "recordId": i,
+            "displayName": f"record-{i}",
+            "rawBytes": b"payload",
+            "nestedValues": {"scoreValue": i * 0.5, "refIds": (i, i + 1)},
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    data = records()
+    print(f"{len(data)} records, {os.cpu_count()} cpus")
+
+    start = perf_counter()
+    Recurser.rsnaked(data)
+    serial = perf_counter() - start
+    print(f"serial      {serial:.3f}s")
+
+    for workers in (1, 2, 4, 8):
+        start = perf_counter()
+        Recurser.rsnaked(data, workers=workers)
+        elapsed = perf_counter() - start
+        print(f"workers={workers:<2}  {elapsed:.3f}s  speedup {serial / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark eager and lazy RecursiveNamespace on large configs."""
+import sys
+from itertools import chain
+from pathlib import Path
+from queue import Queue
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.recursive_namespace import (  # noqa: E402
+    LazyRecursiveNamespace,
+    RecursiveNamespace,
+    compile_path,
+)
+
+
+def config(entities: int = 20000) -> dict:
+    """Build a config with many nested entities."""
+    return {
+        "version": 1,
+        "entities": {
+            f"entity_{i}": {
+                "square_feet": i,
+                "split": i % 4 + 1,
+                "exemptions": [{"name": "gas", "amount": i}],
+                "meta": {"owner": {"name": f"owner-{i}", "active": True}},
+            }
+            for i in range(entities)
+        },
+    }
+
+
+def leaves(count: int = 100000, fanout: int = 10) -> dict:
+    """Build a balanced tree of nested dicts with count leaves."""
+    level = [{f"leaf_{i}": i} for i in range(count // fanout)]
+    while len(level) > 1:
+        level = [
+            {f"node_{j}": x for j, x in enumerate(level[i:i + fanout])}
+            for i in range(0, len(level), fanout)
+        ]
+    return level[0]
+
+
+def legacy_traverse(ns):
+    """Queue based reference matching the pre deque traverse."""
+    stack = Queue()
+    iterator = iter(ns)
+    current = next(iterator, None)
+    if current is not None:
+        stack.put(current)
+    while stack.qsize() != 0:
+        current = stack.get()
+        yield current
+        current = next(iterator, None)
+        if current is not None:
+            stack.put(current)
+            if isinstance(current[1], ns.__class__):
+                iterator = chain(iter(current[1]), iterator)
+
+
+def best(func, number: int = 5) -> float:
+    return min(repeat(func, number=1, repeat=number))
+
+
+def main() -> None:
+    cfg = config()
+
+    def read(ns):
+        return (ns.entities.entity_10.square_feet, ns.entities.entity_500.meta.owner.name)
+
+    for cls in (RecursiveNamespace, LazyRecursiveNamespace):
+        build = best(lambda: cls(**cfg))
+        lookup = best(lambda: read(cls(**cfg)))
+        print(f"{cls.__name__:<24} construct {build:.5f}s  construct+read {lookup:.5f}s")
+
+    tree = RecursiveNamespace(**leaves())
+    for name, func in (
+        ("legacy queue", lambda: sum(1 for _ in legacy_traverse(tree))),
+        ("depth first", lambda: sum(1 for _ in tree.traverse())),
+        ("breadth first", lambda: sum(1 for _ in tree.traverse(breadth_first=True))),
+        ("dotted paths", lambda: sum(1 for _ in tree.traverse(paths=True))),
+    ):
+        print(f"traverse 100k leaves  {name:<14} {best(func):.4f}s")
+
+    ns = RecursiveNamespace(**cfg)
+    getter = compile_path("entities.entity_500.meta.owner.name")
+    for name, func in (
+        ("attribute chain", lambda: ns.entities.entity_500.meta.owner.name),
+        ("get chain", lambda: ns.get("entities").get("entity_500").get("meta").get("owner").get("name")),
+        ("compiled path", lambda: getter(ns)),
+        ("lookup", lambda: ns.lookup("entities.entity_500.meta.owner.name")),
+    ):
+        print(f"lookup x100k  {name:<16} {min(repeat(func, number=100000, repeat=5)):.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Compare shell_split with the previous character by character splitter.
+
+Also measures streaming a command log with iter_shell_split, which keeps
+peak memory at about one chunk instead of the whole file.
+"""
+import io
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.shell_split import iter_shell_split, shell_split  # noqa: E402
+
+
+def legacy(string, braces=False, brackets=False, parentheses=False):
+    """Reference of the previous splitter, which concatenated every character."""
+    release = {"\"": "\"", "'": "'"}
+    if braces:
+        release["{"] = "}"
+    if brackets:
+        release["["] = "]"
+    if parentheses:
+        release["("] = ")"
+
+    opener, parts, tracked = [], [], ""
+    for char in string:
+        if opener:
+            if char == release[opener[0]]:
+                parts.append(tracked)
+                opener.pop()
+                tracked = ""
+            else:
+                tracked = tracked + char
+        elif char in release:
+            opener.append(char)
+            tracked = ""
+        elif char.isspace():
+            if tracked:
+                parts.append(tracked)
+                tracked = ""
+        else:
+            tracked = tracked + char
+    if opener:
+        tracked = opener.pop() + tracked
+    if tracked:
+        parts.append(tracked)
+    return parts
+
+
+def command_log(size: int) -> str:
+    """Build a command log of roughly size characters."""
+    rand = random.Random(0)
+    lines, total = [], 0
+    while total < size:
+        line = " ".join([
+            rand.choice(["git commit -m", "grep -rn", "docker run --env", "echo"]),
+            "\"{0}\"".format(" ".join("word%d" % rand.randrange(1000) for _ in range(rand.randrange(1, 12)))),
+            "{job: %d, retries: [1, 2]}" % rand.randrange(10 ** 6),
+            "--path=/var/log/app-%d.log" % rand.randrange(100),
+        ])
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = perf_counter()
+    func(*args, **kwargs)
+    return perf_counter() - start
+
+
+def main() -> None:
+    for megabytes in (1, 4, 16):
+        text = command_log(megabytes * 2 ** 20)
+        line = f"{megabytes:>3} MB  shell_split {timed(shell_split, text, braces=True, brackets=True):.3f}s"
+        if megabytes <= 4:
+            line += f"  legacy {timed(legacy, text, braces=True, brackets=True):.3f}s"
+        print(line)
+
+    # One Long Quoted Token, Quadratic With Repeated Concatenation
+    text = "\"{0}\"".format("x" * 2 ** 22)
+    print(f"4 MB token  shell_split {timed(shell_split, text):.4f}s  legacy {timed(legacy, text):.3f}s")
+
+    # Stream a Log Instead of Reading it Whole
+    text = command_log(16 * 2 ** 20)
+    for name, func in (
+        ("read whole", lambda fp: [shell_split(line, braces=True, brackets=True) for line in fp.read().splitlines()]),
+        ("iter lines", lambda fp: sum(1 for _ in iter_shell_split(fp, braces=True, brackets=True, lines=True))),
+    ):
+        elapsed = timed(func, io.StringIO(text))
+        source = io.StringIO(text)
+        tracemalloc.start()
+        func(source)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"16 MB {name}  {elapsed:.3f}s  peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
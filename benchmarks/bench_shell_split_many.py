@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Benchmark batch and multi-process shell_split throughput."""
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.shell_split import shell_split, shell_split_many  # noqa: E402
+from bench_shell_split import command_log  # noqa: E402
+
+
+def main() -> None:
+    lines = command_log(64 * 2 ** 20).splitlines()
+    cpus = os.cpu_count() or 1
+    print(f"{len(lines)} lines, {cpus} cpus")
+
+    start = perf_counter()
+    [shell_split(line, braces=True, brackets=True) for line in lines]
+    elapsed = perf_counter() - start
+    print(f"one call per line  {len(lines) / elapsed:>12,.0f} lines/s")
+
+    start = perf_counter()
+    shell_split_many(lines, braces=True, brackets=True)
+    elapsed = perf_counter() - start
+    print(f"batch              {len(lines) / elapsed:>12,.0f} lines/s")
+
+    for workers in (1, 2, 4, 8):
+        start = perf_counter()
+        shell_split_many(lines, braces=True, brackets=True, workers=workers)
+        rate = len(lines) / (perf_counter() - start)
+        print(f"workers={workers:<2}         {rate:>12,.0f} lines/s  {rate / min(workers, cpus):>12,.0f} per core")
+
+
+if __name__ == "__main__":
+    main()
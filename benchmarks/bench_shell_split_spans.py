@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Compare token strings with token offsets over a memory mapped log."""
+import mmap
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.refactor.shell_split import shell_split, shell_split_spans  # noqa: E402
+from bench_shell_split import command_log  # noqa: E402
+
+
+def measure(func, *args) -> tuple:
+    start = perf_counter()
+    result = func(*args)
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main(megabytes: int = 32) -> None:
+    with tempfile.TemporaryFile() as fp:
+        fp.write(command_log(megabytes * 2 ** 20).encode())
+        fp.flush()
+        buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        elapsed, peak, tokens = measure(lambda: shell_split(buf[:].decode(), braces=True))
+        print(f"shell_split(decoded)  {elapsed:.3f}s  peak {peak / 2 ** 20:.1f} MiB  {len(tokens)} tokens")
+
+        elapsed, peak, spans = measure(shell_split_spans, buf, True)
+        print(f"shell_split_spans     {elapsed:.3f}s  peak {peak / 2 ** 20:.1f} MiB  {len(spans) // 3} tokens")
+        del spans
+        buf.close()
+
+
+if __name__ == "__main__":
+    main()
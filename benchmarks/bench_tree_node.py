@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark rendering a million node tree with Node.display_to.
+
+The legacy reference is the previous recursive renderer, run with a fresh
+result list; it fails once the tree is deeper than the recursion limit.
+"""
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.tree_node import Node  # noqa: E402
+
+
+class Discard:
+    """Text sink so output size does not count towards peak memory."""
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+
+def legacy(node: Node, last: str = "", prefix: str = "", string: list = None) -> str:
+    """Reference of the previous recursive display."""
+    string = [] if string is None else string
+    if len(prefix) == 0:
+        current = f"{prefix}└─ "
+    elif node.parent.children[-1] is not node:
+        current = f"{prefix}├─ "
+    elif last == "├":
+        current = f"{prefix}└─ "
+    else:
+        current = f"{''.join([prefix[:-3], (3 * ' ')])}└─ "
+    last = current[-3]
+    prefix += f"│{2 * ' '}" if last == "├" else f"{3 * ' '}"
+    string.append("".join([current, str(node.data)]))
+    for child in node.children:
+        legacy(child, last=last, prefix=prefix, string=string)
+    return "\n".join(string)
+
+
+def random_tree(count: int = 1000000, seed: int = 0) -> Node:
+    """Build a random recursive tree, every node picks any earlier parent."""
+    rand = random.Random(seed)
+    nodes = [Node(0)]
+    for i in range(1, count):
+        parent = nodes[rand.randrange(i)]
+        parent.add_child(i)
+        nodes.append(parent.children[-1])
+    return nodes[0]
+
+
+def main() -> None:
+    root = random_tree()
+
+    start = perf_counter()
+    root.display_to(Discard())
+    print(f"display_to  {perf_counter() - start:.3f}s")
+
+    tracemalloc.start()
+    root.display_to(Discard())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"display_to  peak {peak / 2 ** 20:.2f} MiB")
+
+    start = perf_counter()
+    text = root.display()
+    print(f"display     {perf_counter() - start:.3f}s  {len(text) / 2 ** 20:.0f} MiB string")
+
+    # Previous Renderer Joined All Lines After Every Node, so Compare Smaller Trees
+    for count in (10000, 40000):
+        small = random_tree(count)
+        start = perf_counter()
+        small.display()
+        elapsed = perf_counter() - start
+        start = perf_counter()
+        legacy(small)
+        print(f"{count:>6} nodes  display {elapsed:.3f}s  legacy {perf_counter() - start:.3f}s")
+
+    # Chain Deeper Than the Recursion Limit
+    chain = current = Node(0)
+    for i in range(1, 5000):
+        current.add_child(i)
+        current = current.children[0]
+    start = perf_counter()
+    chain.display_to(Discard())
+    print(f"depth 5000  display_to {perf_counter() - start:.3f}s")
+    try:
+        legacy(chain)
+    except RecursionError:
+        print("depth 5000  legacy RecursionError")
+
+
+if __name__ == "__main__":
+    main()
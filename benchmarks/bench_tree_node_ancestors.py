@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Compare parent walking ancestor queries with a Node ancestor index."""
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.tree_node import Node  # noqa: E402
+
+
+def deep_tree(count: int = 200000, seed: int = 0) -> list:
+    """Build a deep tree where every node picks a parent among the last 10 nodes."""
+    rand = random.Random(seed)
+    nodes = [Node(0)]
+    for i in range(1, count):
+        parent = nodes[rand.randrange(max(0, i - 10), i)]
+        parent.add_child(i)
+        nodes.append(parent.children[-1])
+    return nodes
+
+
+def queries(nodes: list, count: int = 2000, seed: int = 1):
+    rand = random.Random(seed)
+    return [(rand.choice(nodes), rand.choice(nodes)) for _ in range(count)]
+
+
+def timed(pairs: list) -> float:
+    start = perf_counter()
+    for first, second in pairs:
+        first.lca(second)
+        first.is_ancestor(second)
+        first.kth_ancestor(first.depth // 2)
+    return perf_counter() - start
+
+
+def main() -> None:
+    nodes = deep_tree()
+    pairs = queries(nodes)
+    depth = max(node.depth for node in nodes)
+    print(f"{len(nodes)} nodes, depth {depth}, {len(pairs)} query rounds")
+
+    print(f"parent walks  {timed(pairs):.3f}s")
+
+    start = perf_counter()
+    nodes[0].build_index()
+    print(f"build_index   {perf_counter() - start:.3f}s")
+    print(f"indexed       {timed(pairs):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
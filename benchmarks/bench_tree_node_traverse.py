@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Compare Node.traverse orders with the previous LifoQueue iteration."""
+import sys
+from pathlib import Path
+from queue import LifoQueue
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from modules.tree_node import Node  # noqa: E402
+from bench_tree_node import random_tree  # noqa: E402
+
+
+def legacy(node: Node):
+    """Reference of the previous __iter__, which locked on every put/get."""
+    stack = LifoQueue()
+    stack.put(node)
+    while stack.qsize() > 0:
+        current = stack.get()
+        for child in current.children:
+            stack.put(child)
+        yield current
+
+
+def timed(iterable) -> float:
+    start = perf_counter()
+    for _ in iterable:
+        pass
+    return perf_counter() - start
+
+
+def main(count: int = 1000000) -> None:
+    root = random_tree(count)
+    baseline = timed(legacy(root))
+    print(f"{count} nodes  legacy LifoQueue {baseline:.3f}s")
+
+    for order in ("pre", "post", "level", "leaves"):
+        for depths in (False, True):
+            elapsed = timed(root.traverse(order, depths=depths))
+            name = f"{order}{' + depths' if depths else ''}"
+            print(f"{name:<16} {elapsed:.3f}s  {baseline / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
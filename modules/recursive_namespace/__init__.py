@@ -1,9 +1,31 @@
 #!/usr/bin/env python3.8
 
-from itertools import chain
-from queue import Queue
+import re
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
 from types import SimpleNamespace
-from typing import Any, Generator, List, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Tuple,
+    ValuesView,
+)
+
+
+# Frozen Namespace Key Schemas Given Their Own Class
+SCHEMA_CACHE_SIZE = 1024
+
+# Path Segments: .name, name, [index] or [*]
+_PATH_SEGMENT = re.compile(r"(?:^|\.)([^.\[\]]+)|\[(\d+|\*)\]")
 
 
 class RecursiveNamespace(SimpleNamespace):
@@ -11,11 +33,12 @@ class RecursiveNamespace(SimpleNamespace):
     def __init__(self, **kwargs: Any) -> None:
         """Recursively create self for nested namespace conversions."""
         super().__init__(**kwargs)
+        attrs = vars(self)
         for k, v in kwargs.items():
             if type(v) == dict:
-                setattr(self, k, RecursiveNamespace(**v))
+                attrs[k] = RecursiveNamespace(**v)
             elif type(v) == list:
-                setattr(self, k, list(map(self.__mapper, v)))
+                attrs[k] = list(map(self.__mapper, v))
 
     def __mapper(self, val: Any) -> Any:
         """Create self if val is a dictionary, else return the object."""
@@ -27,38 +50,78 @@ class RecursiveNamespace(SimpleNamespace):
         """dict.get() implementation for namespace."""
         return getattr(self, key, default)
 
-    def items(self) -> List[Tuple[str, Any]]:
+    def lookup(self, path: str, default: Any = None) -> Any:
+        """Get a nested value by dotted path such as a.b[3].c.
+
+        Paths are resolved through the cached compile_path getter, so they
+        always reflect the current values, including changes made inside
+        lists. Wildcard paths such as a.*.c or a.b[*].c return a list of
+        every matching value.
+        """
+        try:
+            return compile_path(path)(self)
+        except (AttributeError, IndexError, KeyError, TypeError):
+            return default
+
+    def keys(self) -> KeysView:
+        """dict.keys() implementation for namespace."""
+        return vars(self).keys()
+
+    def values(self) -> ValuesView:
+        """dict.values() implementation for namespace."""
+        return vars(self).values()
+
+    def items(self) -> ItemsView:
         """dict.items() implementation for namespace."""
-        items = []
-        for key, value in vars(self).items():
-            items.append((key, value))
-        return items
-
-    def traverse(self) -> Generator:
-        """Get all values including nested namespace values."""
-        # Stack Setup
-        stack = Queue()
-        iterator = iter(self)
-        current = next(iterator, None)
-
-        # Ensure Namespace isnt Empty
-        if current is not None:
-            stack.put(current)
-
-        # Until Exausted
-        while stack.qsize() != 0:
-            # Get and Yield
-            current = stack.get()
-            yield current
-
-            # Get Next in Generator
-            current = next(iterator, None)
-
-            # Chain Generators if Nested Namespace
-            if current is not None:
-                stack.put(current)
-                if isinstance(current[1], self.__class__):
-                    iterator = chain(iter(current[1]), iterator)
+        return vars(self).items()
+
+    def traverse(
+        self,
+        breadth_first: bool = False,
+        paths: bool = False,
+        lists: bool = False,
+        until: Callable[[Any, Any], bool] = None,
+    ) -> Generator:
+        """Get all values including nested namespace values.
+
+        :param breadth_first: yield level by level instead of depth first
+        :param paths: yield dotted paths such as a.b[3].c instead of keys
+        :param lists: descend into lists, yielding elements by index
+        :param until: stop after yielding the first (key, value) it is true for
+        :return: generator of (key, value) tuples
+        """
+        # Frames of (path prefix, child iterator)
+        frames = deque([("", iter(self))])
+        while frames:
+            if breadth_first:
+                prefix, iterator = frames.popleft()
+            else:
+                prefix, iterator = frames[-1]
+
+            for key, value in iterator:
+                # Build Dotted Path
+                if paths:
+                    if type(key) == int:
+                        key = f"{prefix}[{key}]"
+                    elif prefix:
+                        key = f"{prefix}.{key}"
+
+                yield (key, value)
+                if until is not None and until(key, value):
+                    return
+
+                # Descend Into Namespaces and Optionally Lists
+                if isinstance(value, RecursiveNamespace):
+                    frames.append((key, iter(value)))
+                elif lists and type(value) == list:
+                    frames.append((key, enumerate(value)))
+                else:
+                    continue
+                if not breadth_first:
+                    break
+            else:
+                if not breadth_first:
+                    frames.pop()
 
     def __getitem__(self, key: str) -> Any:
         """Allows obj[var] notation."""
@@ -72,15 +135,413 @@ class RecursiveNamespace(SimpleNamespace):
         """Allows del obj[key] notation."""
         delattr(self, key)
 
+    def __contains__(self, key: str) -> bool:
+        """Allows key in obj notation."""
+        return key in vars(self)
+
     def __len__(self) -> int:
         """Get length of attributes in namespace."""
-        count = 0
-        for _ in self:
-            count += 1
+        return len(vars(self))
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over attributes."""
+        return iter(vars(self).items())
+
+
+# Wildcard Steps Expanding Namespace Values and List Elements
+_ANY_VALUE = "*"
+_ANY_ITEM = "[*]"
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """Compile a dotted path such as a.b[3].c into a getter.
+
+    Plain paths become a single chained attrgetter/itemgetter call. A *
+    segment matches every value of a namespace and [*] every element of a
+    list, in which case the getter returns a flat list of matches. Values
+    a wildcard cannot expand, and values missing the rest of the path, are
+    skipped.
+
+    :param path: dotted path to a nested value
+    :return: callable taking a namespace and returning the value
+    """
+    # Parse Segments into Getters, Merging Runs of Attribute Names
+    steps, position = [], 0
+    for match in _PATH_SEGMENT.finditer(path):
+        if match.start() != position:
+            break
+        position = match.end()
+        name, index = match.groups()
+        if name == "*":
+            steps.append(_ANY_VALUE)
+        elif index == "*":
+            steps.append(_ANY_ITEM)
+        elif name is not None and steps and isinstance(steps[-1], list):
+            steps[-1].append(name)
+        elif name is not None:
+            steps.append([name])
+        else:
+            steps.append(itemgetter(int(index)))
+
+    if not path or position != len(path):
+        raise ValueError(f"invalid path {path!r}")
+
+    steps = [
+        attrgetter(".".join(x)) if isinstance(x, list) else x for x in steps
+    ]
+
+    # Plain Paths Chain Getters Directly
+    if _ANY_VALUE not in steps and _ANY_ITEM not in steps:
+        if len(steps) == 1:
+            return steps[0]
+
+        def getter(obj: Any) -> Any:
+            for step in steps:
+                obj = step(obj)
+            return obj
+
+        return getter
+
+    def query(obj: Any) -> List[Any]:
+        matches = [obj]
+        for step in steps:
+            if step is _ANY_VALUE:
+                matches = [
+                    x
+                    for match in matches
+                    if isinstance(match, RecursiveNamespace)
+                    for x in type(match).values(match)
+                ]
+                continue
+            elif step is _ANY_ITEM:
+                matches = [
+                    x
+                    for match in matches
+                    if isinstance(match, list)
+                    for x in match
+                ]
+                continue
+
+            found = []
+            for match in matches:
+                try:
+                    found.append(step(match))
+                except (AttributeError, IndexError, KeyError, TypeError):
+                    continue
+            matches = found
+
+        return matches
+
+    return query
+
+
+# Frozen Namespace Classes Keyed by Key Schema
+_SCHEMAS = {}
+
+
+class FrozenNamespace(tuple):
+    """Immutable, hashable namespace stored as a tuple of values.
+
+    Keys are held once per key schema on a shared generated subclass with
+    read only properties, so instances carry no per-instance __dict__.
+    Once SCHEMA_CACHE_SIZE schemas exist, records with new key schemas are
+    stored with their keys instead, so data dependent keys do not create
+    a class per record. Nested dictionaries become frozen namespaces and
+    lists become tuples.
+    """
+    __slots__ = ()
+    __fields: Tuple[Any, ...] = ()
+    __index: Dict[Any, int] = {}
+
+    def __new__(cls, **kwargs: Any) -> "FrozenNamespace":
+        """Create a frozen namespace of the class matching the key schema."""
+        return cls.from_dict(kwargs)
+
+    @classmethod
+    def from_dict(cls, val: Dict[Any, Any]) -> "FrozenNamespace":
+        """Recursively create a frozen namespace from a dictionary."""
+        return _make(tuple(val), map(_freeze, val.values()))
+
+    @staticmethod
+    def schema(keys: Tuple[Any, ...]) -> type:
+        """Get the shared frozen namespace class for a tuple of keys.
+
+        Past SCHEMA_CACHE_SIZE schemas, keys without a class get the
+        generic class storing keys per instance.
+        """
+        try:
+            return _SCHEMAS[keys]
+        except KeyError:
+            if len(_SCHEMAS) >= SCHEMA_CACHE_SIZE:
+                return _KeyedFrozenNamespace
+
+        namespace = {
+            "__slots__": (),
+            "_FrozenNamespace__fields": keys,
+            "_FrozenNamespace__index": {k: i for i, k in enumerate(keys)},
+        }
+        for i, key in enumerate(keys):
+            if _is_attribute(key):
+                namespace[key] = _item_property(i)
+
+        cls = _SCHEMAS[keys] = type(
+            FrozenNamespace.__name__, (FrozenNamespace,), namespace
+        )
+        return cls
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """dict.get() implementation for namespace."""
+        index = self.__index.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self) -> Tuple[Any, ...]:
+        """dict.keys() implementation for namespace."""
+        return self.__fields
+
+    def values(self) -> Tuple[Any, ...]:
+        """dict.values() implementation for namespace."""
+        return tuple(self.__values())
+
+    def items(self) -> Tuple[Tuple[Any, Any], ...]:
+        """dict.items() implementation for namespace."""
+        return tuple(zip(self.__fields, self.__values()))
+
+    def __values(self) -> Iterator[Any]:
+        """Iterate over the stored values."""
+        return tuple.__iter__(self)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Allows obj[var] notation."""
+        try:
+            return tuple.__getitem__(self, self.__index[key])
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __contains__(self, key: Any) -> bool:
+        """Allows key in obj notation."""
+        return key in self.__index
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over attributes."""
+        return zip(self.__fields, self.__values())
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare key schemas and values."""
+        return type(self) is type(other) and tuple.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        """Compare key schemas and values."""
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        """Hash key schema and values."""
+        return hash((self.__fields, tuple.__hash__(self)))
+
+    def __repr__(self) -> str:
+        """Represent namespace like SimpleNamespace."""
+        attrs = ", ".join(f"{k}={v!r}" for k, v in self)
+        return f"{FrozenNamespace.__name__}({attrs})"
+
+    def __reduce__(self) -> Tuple:
+        """Pickle namespace by its key schema and values."""
+        return (_make, (self.__fields, tuple(self.__values())))
+
+
+class _KeyedFrozenNamespace(FrozenNamespace):
+    """Frozen namespace stored as (keys, *values) for uncached schemas."""
+    __slots__ = ()
+
+    @property
+    def _FrozenNamespace__fields(self) -> Tuple[Any, ...]:
+        return tuple.__getitem__(self, 0)
+
+    @property
+    def _FrozenNamespace__index(self) -> Dict[Any, int]:
+        return {k: i for i, k in enumerate(tuple.__getitem__(self, 0), 1)}
+
+    def _FrozenNamespace__values(self) -> Iterator[Any]:
+        return islice(tuple.__iter__(self), 1, None)
+
+    def __len__(self) -> int:
+        """Get number of keys in namespace."""
+        return tuple.__len__(self) - 1
+
+    def __getattr__(self, key: str) -> Any:
+        """Read keys as attributes, as the schema class properties do."""
+        if not _is_attribute(key):
+            raise AttributeError(key)
+        return self[key]
+
+
+def _make(keys: Tuple[Any, ...], values: Iterable[Any]) -> FrozenNamespace:
+    """Create a frozen namespace of the class matching a key schema."""
+    cls = FrozenNamespace.schema(keys)
+    if cls is _KeyedFrozenNamespace:
+        return tuple.__new__(cls, (keys, *values))
+    return tuple.__new__(cls, values)
+
+
+def _is_attribute(key: Any) -> bool:
+    """Check whether a key is exposed as a frozen namespace attribute."""
+    return (
+        isinstance(key, str)
+        and key.isidentifier()
+        and not key.startswith("__")
+    )
+
+
+def _item_property(index: int) -> property:
+    """Read a tuple item, bypassing the overridden __getitem__."""
+    return property(lambda self: tuple.__getitem__(self, index))
+
+
+def _freeze(val: Any) -> Any:
+    """Freeze dictionaries and lists nested within a frozen namespace value."""
+    if type(val) == dict:
+        return FrozenNamespace.from_dict(val)
+    elif type(val) == list:
+        return tuple(map(_freeze, val))
+    return val
+
+
+# Public Attribute Names of Lazy Namespace Classes
+_METHOD_NAMES = {}
+
+
+class LazyRecursiveNamespace(RecursiveNamespace):
+    """Recursively create namespaces for nested structs on first access.
 
-        return count
+    Nested dictionaries are kept as a backing dict and only wrapped when the
+    attribute is first read, after which the namespace is cached. Methods
+    viewing the whole namespace resolve a single level before running.
+    """
+    __slots__ = ("__source", "__owned")
 
-    def __iter__(self) -> Generator:
+    def __init__(self, **kwargs: Any) -> None:
+        """Keep kwargs as the backing dict without converting nested values."""
+        self.__source = kwargs
+        self.__owned = True
+        self.__shadow()
+
+    @classmethod
+    def wrap(cls, source: Dict[str, Any]) -> "LazyRecursiveNamespace":
+        """Create a namespace backed by source without copying it."""
+        obj = cls.__new__(cls)
+        obj.__source = source
+        obj.__owned = False
+        obj.__shadow()
+        return obj
+
+    def __shadow(self) -> None:
+        """Let keys named like methods shadow them, as in eager namespaces."""
+        cls = self.__class__
+        names = _METHOD_NAMES.get(cls)
+        if names is None:
+            names = _METHOD_NAMES[cls] = tuple(
+                x for x in dir(cls) if not x.startswith("_")
+            )
+
+        for name in names:
+            if name in self.__source:
+                vars(self)[name] = self.__wrap(self.__source[name])
+
+    def __wrap(self, val: Any) -> Any:
+        """Wrap dictionaries and lists of dictionaries in lazy namespaces."""
+        if type(val) == dict:
+            return type(self).wrap(val)
+        elif type(val) == list:
+            wrap = type(self).wrap
+            return [wrap(x) if isinstance(x, dict) else x for x in val]
+        return val
+
+    def __resolve(self) -> None:
+        """Wrap all pending attributes, keeping the backing dict order."""
+        if not self.__source:
+            return
+
+        attrs = vars(self)
+        ordered = {
+            k: attrs[k] if k in attrs else self.__wrap(v)
+            for k, v in self.__source.items()
+        }
+        ordered.update(attrs)
+        attrs.clear()
+        attrs.update(ordered)
+
+        # Everything Now Lives in Instance Dict
+        self.__source = {}
+        self.__owned = True
+
+    def __getattr__(self, key: str) -> Any:
+        """Wrap and cache attributes on first access."""
+        try:
+            val = self.__source[key]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {key!r}"
+            ) from None
+
+        val = self.__wrap(val)
+        vars(self)[key] = val
+        return val
+
+    def __delattr__(self, key: str) -> None:
+        """Delete attribute from both the cache and the backing dict."""
+        attrs = vars(self)
+        if key not in attrs and key not in self.__source:
+            raise AttributeError(key)
+
+        # Copy Backing Dict Before Mutating Callers Data
+        if key in self.__source:
+            if not self.__owned:
+                self.__source = dict(self.__source)
+                self.__owned = True
+            del self.__source[key]
+        attrs.pop(key, None)
+
+    def keys(self) -> KeysView:
+        """dict.keys() implementation for namespace."""
+        self.__resolve()
+        return super().keys()
+
+    def values(self) -> ValuesView:
+        """dict.values() implementation for namespace."""
+        self.__resolve()
+        return super().values()
+
+    def items(self) -> ItemsView:
+        """dict.items() implementation for namespace."""
+        self.__resolve()
+        return super().items()
+
+    def __contains__(self, key: str) -> bool:
+        """Allows key in obj notation without resolving attributes."""
+        return key in vars(self) or key in self.__source
+
+    def __len__(self) -> int:
+        """Get length of attributes in namespace."""
+        self.__resolve()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
         """Iterate over attributes."""
-        for key, value in vars(self).items():
-            yield (key, value)
+        self.__resolve()
+        return super().__iter__()
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare namespaces after resolving pending attributes."""
+        self.__resolve()
+        if isinstance(other, LazyRecursiveNamespace):
+            other.__resolve()
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        """Represent namespace after resolving pending attributes."""
+        self.__resolve()
+        return super().__repr__()
+
+    def __reduce__(self) -> Tuple:
+        """Pickle namespace after resolving pending attributes."""
+        self.__resolve()
+        return super().__reduce__()
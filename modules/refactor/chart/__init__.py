@@ -1,4 +1,53 @@
-from typing import Dict, List
+import sys
+from itertools import chain, islice, starmap
+from types import MappingProxyType
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+
+def _is_array(value: Any) -> bool:
+    """Check for a NumPy array without importing NumPy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _strings(column: Iterable[Any]) -> List[str]:
+    """Convert a column to strings, in bulk for NumPy arrays."""
+    if _is_array(column):
+        return column.astype(str).tolist()
+    return list(map(str, column))
+
+
+# Read Only Tables Shared by Every Render
+_ALIGNMENT = MappingProxyType({
+    "center": "^",
+    "left": "<",
+    "right": ">",
+})
+
+_DELIMS = MappingProxyType({
+    "down_horizontal": u"\u2500\u252C\u2500",
+    "horizontal": u"\u2500",
+    "vertical": u" \u2502 ",
+    "vertical_horizontal": u"\u2500\u253C\u2500",
+    "up_horizontal": u"\u2500\u2534\u2500",
+    "down_right": u"\u250C\u2500",
+    "down_left": u"\u2500\u2510",
+    "up_right": u"\u2514\u2500",
+    "up_left": u"\u2500\u2518",
+    "vertical_right": u"\u251C\u2500",
+    "vertical_left": u"\u2500\u2524",
+})
 
 
 class NoInstance(type):
@@ -13,114 +62,544 @@ class NoInstance(type):
         return cls.__call__(cls, headers, table, align)
 
     @property
-    def alignment(self) -> Dict[str, str]:
-        return {
-            "center": "^",
-            "left": "<",
-            "right": ">",
-        }
+    def alignment(self) -> Mapping[str, str]:
+        return _ALIGNMENT
 
     @property
-    def delims(self) -> Dict[str, str]:
-        return{
-            "down_horizontal": u"\u2500\u252C\u2500",
-            "horizontal": u"\u2500",
-            "vertical": u" \u2502 ",
-            "vertical_horizontal": u"\u2500\u253C\u2500",
-            "up_horizontal": u"\u2500\u2534\u2500",
-            "down_right": u"\u250C\u2500",
-            "down_left": u"\u2500\u2510",
-            "up_right": u"\u2514\u2500",
-            "up_left": u"\u2500\u2518",
-            "vertical_right": u"\u251C\u2500",
-            "vertical_left": u"\u2500\u2524",
-        }
+    def delims(self) -> Mapping[str, str]:
+        return _DELIMS
+
+
+Table = Union[Sequence[Sequence[Any]], Mapping[str, Sequence[Any]]]
 
 
 class Chart(object, metaclass=NoInstance):
+    # Rows Converted to Columns at a Time When Streaming
+    block_size = 4096
+
     def __call__(
         self,
         headers: List[str],
-        table: List[str],
+        table: Table,
         align: str = "center"
     ) -> str:
         """Create a table from a list of headers and matrix of data.
 
+        The table may also be columnar: a mapping of header to column or a
+        two dimensional NumPy array. Each column is converted to strings once
+        and the strings are reused for both the widths and the rows.
+
         :param headers: list of strings with headers for columns
-        :param table: matrix of data to fill table with
+        :param table: matrix of data or mapping of columns to fill table with
         :param align: alignment of strings inside cells
         :return str: table representation of headers/matrix
         """
-        # Init Column Length Map
-        columns = {}
+        columns = self._columns(headers, table)
+        return self.compile(
+            headers, self._widths(headers, [columns]), align
+        )._render(columns)
+
+    @classmethod
+    def render_to(
+        cls,
+        fp: TextIO,
+        headers: List[str],
+        rows: Table,
+        align: str = "center",
+        sample: Optional[int] = None
+    ) -> None:
+        """Write a table to a file object one row at a time.
+
+        Column widths are found with a first pass over rows, so rows must be
+        re-iterable (e.g. a list or a sequence view) unless a sample size is
+        given. With a sample, widths come from the headers and the first
+        sample rows only, and any wider cells afterwards overflow their
+        column instead of being truncated. Columnar tables are already in
+        memory and are converted once.
+
+        :param fp: text file object to write the table to
+        :param headers: list of strings with headers for columns
+        :param rows: iterable of rows or mapping of columns to fill table with
+        :param align: alignment of strings inside cells
+        :param sample: number of leading rows used to determine widths
+        """
+        if isinstance(rows, Mapping) or _is_array(rows):
+            blocks = [cls._columns(headers, rows)]
+            widths = cls._widths(headers, blocks)
+        elif sample is None:
+            if iter(rows) is rows:
+                raise TypeError(
+                    "rows must be re-iterable when no sample size is given"
+                )
+            widths = cls._widths(headers, cls._blocks(headers, rows))
+            blocks = cls._blocks(headers, rows)
+        else:
+            # Buffer Sampled Rows and Write Them Ahead of the Remainder
+            rows = iter(rows)
+            head = list(cls._blocks(headers, islice(rows, sample)))
+            widths = cls._widths(headers, head)
+            blocks = chain(head, cls._blocks(headers, rows))
+
+        cls.compile(headers, widths, align, truncate=False)._write(fp, blocks)
+
+    @classmethod
+    def compile(
+        cls,
+        headers: List[str],
+        widths: Sequence[int],
+        align: str = "center",
+        truncate: bool = True
+    ) -> "CompiledChart":
+        """Build a reusable layout for repeated renders of the same table.
+
+        :param headers: list of strings with headers for columns
+        :param widths: fixed width of every column
+        :param align: alignment of strings inside cells
+        :param truncate: cut longer cells to the width instead of overflowing
+        :return CompiledChart: layout with precomputed borders and template
+        """
+        return CompiledChart(headers, widths, align, truncate)
+
+    @classmethod
+    def pager(
+        cls,
+        headers: List[str],
+        table: Table,
+        align: str = "center",
+        page_size: int = 50,
+        widths: Optional[Sequence[int]] = None
+    ) -> "ChartPager":
+        """Build a paginated view that renders only the rows shown.
+
+        :param headers: list of strings with headers for columns
+        :param table: sequence of rows, mapping of columns or NumPy array
+        :param align: alignment of strings inside cells
+        :param page_size: number of rows on every page
+        :param widths: fixed column widths, found from the whole table if None
+        :return ChartPager: windowed view over the table
+        """
+        return ChartPager(headers, table, align, page_size, widths)
 
-        # Ensure Headers Match Table Sublists
-        for sublist in table:
-            if len(sublist) != len(headers):
+    @classmethod
+    def live(
+        cls,
+        headers: List[str],
+        rows: Iterable[Sequence[Any]] = (),
+        align: str = "center"
+    ) -> "LiveChart":
+        """Build a table that redraws only the rows that change.
+
+        :param headers: list of strings with headers for columns
+        :param rows: initial rows of the table
+        :param align: alignment of strings inside cells
+        :return LiveChart: editable table with diff based terminal output
+        """
+        return LiveChart(headers, rows, align)
+
+    @classmethod
+    def _columns(cls, headers: List[str], table: Table) -> List[List[str]]:
+        """Convert a table of rows or columns to columns of strings."""
+        if isinstance(table, Mapping):
+            columns = [table[header] for header in headers]
+        elif _is_array(table):
+            if table.ndim != 2 or table.shape[1] != len(headers):
                 raise Exception("headers do match the length of table items")
-            else:
-                for i in range(len(sublist)):
-                    # Determine Column Length
-                    data_len = len(str(sublist[i]))
-                    if columns.get(i) is None:
-                        columns[i] = data_len
+            columns = list(table.T)
+        else:
+            for sublist in table:
+                if len(sublist) != len(headers):
+                    raise Exception(
+                        "headers do match the length of table items"
+                    )
+            columns = list(zip(*table)) or [()] * len(headers)
+
+        columns = [_strings(column) for column in columns]
+        if len({len(column) for column in columns}) > 1:
+            raise Exception("columns do not have the same length")
+        return columns
+
+    @classmethod
+    def _blocks(
+        cls,
+        headers: List[str],
+        rows: Iterable[Sequence[Any]]
+    ) -> Iterator[List[List[str]]]:
+        """Convert rows to string columns, block_size rows at a time."""
+        rows = iter(rows)
+        while True:
+            block = list(islice(rows, cls.block_size))
+            if not block:
+                return
+            yield cls._columns(headers, block)
+
+    @classmethod
+    def _widths(
+        cls,
+        headers: List[str],
+        blocks: Iterable[List[List[str]]]
+    ) -> List[int]:
+        """Find the widest cell of every column, including the headers."""
+        widths = [len(header) for header in headers]
+        for columns in blocks:
+            for i, column in enumerate(columns):
+                widths[i] = max(widths[i], max(map(len, column), default=0))
+        return widths
+
+
+class CompiledChart(object):
+    """Table layout with borders and row template built once.
 
-                    # Adjust for Headers
-                    if len(headers[i]) > columns[i]:
-                        columns[i] = len(headers[i])
+    Cells are padded to the fixed column widths, and longer cells are
+    truncated unless truncate is False, so every render of new data costs
+    one format call per row and a single join.
+    """
+    __slots__ = (
+        "headers", "widths", "align", "truncate", "_head", "_row", "_bottom"
+    )
+
+    def __init__(
+        self,
+        headers: List[str],
+        widths: Sequence[int],
+        align: str = "center",
+        truncate: bool = True
+    ) -> None:
+        """Precompute the borders and row template of a table.
+
+        :param headers: list of strings with headers for columns
+        :param widths: fixed width of every column
+        :param align: alignment of strings inside cells
+        :param truncate: cut longer cells to the width instead of overflowing
+        """
+        if len(widths) != len(headers):
+            raise Exception("headers do match the length of widths")
+        self.headers, self.widths = list(headers), list(widths)
+        self.align, self.truncate = align, truncate
 
         # Build Format Template Slots
+        slot = (
+            "{{{index}:{alignment}{padding}.{padding}}}" if truncate
+            else "{{{index}:{alignment}{padding}}}"
+        )
         t_row, t_header, t_border = [], [], []
-        for i in range(len(headers)):
-            t_header.append("{{{index}:{alignment}{padding}}}".format(
+        for i, width in enumerate(self.widths):
+            t_header.append(slot.format(
                 index=i,
-                alignment=self.alignment.get("center"),
-                padding=columns[i]
+                alignment=_ALIGNMENT["center"],
+                padding=width
             ))
-            t_border.append(self.delims["horizontal"] * (columns[i]))
-            t_row.append("{{{index}:{alignment}{padding}}}".format(
+            t_border.append(_DELIMS["horizontal"] * width)
+            t_row.append(slot.format(
                 index=i,
-                alignment=self.alignment.get(align, "^"),
-                padding=columns[i]
+                alignment=_ALIGNMENT.get(align, "^"),
+                padding=width
             ))
 
-        # Build Full Format Tempaltes
-        t_row = self.delims["vertical"].join(t_row)
-        t_header = self.delims["vertical"].join(t_header)
+        # Build Full Format Templates, Including Outer Borders
+        lborder, rborder = _DELIMS["vertical"][1:], _DELIMS["vertical"][:-1]
+        t_row = lborder + _DELIMS["vertical"].join(t_row) + rborder
+        t_header = lborder + _DELIMS["vertical"].join(t_header) + rborder
 
-        # Initialize Chart
-        chart = "{topline}\n{headers}\n{border}\n".format(
-            topline="{0}{1}{2}".format(
-                self.delims["down_right"],
-                self.delims["down_horizontal"].join(t_border),
-                self.delims["down_left"]
+        self._head = "\n".join([
+            "{0}{1}{2}".format(
+                _DELIMS["down_right"],
+                _DELIMS["down_horizontal"].join(t_border),
+                _DELIMS["down_left"]
             ),
-            headers="{0}{1}{2}".format(
-                self.delims["vertical"][1:],
-                t_header.format(*headers),
-                self.delims["vertical"][:-1],
+            t_header.format(*map(str, headers)),
+            "{0}{1}{2}".format(
+                _DELIMS["vertical_right"],
+                _DELIMS["vertical_horizontal"].join(t_border),
+                _DELIMS["vertical_left"],
             ),
-            border="{0}{1}{2}".format(
-                self.delims["vertical_right"],
-                self.delims["vertical_horizontal"].join(t_border),
-                self.delims["vertical_left"],
-            )
+        ])
+        self._row = t_row.format
+        self._bottom = "{0}{1}{2}".format(
+            _DELIMS["up_right"],
+            _DELIMS["up_horizontal"].join(t_border),
+            _DELIMS["up_left"],
+        )
+
+    def __repr__(self) -> str:
+        return "{0}({1!r}, {2!r}, {3!r}, {4!r})".format(
+            type(self).__name__, self.headers, self.widths, self.align,
+            self.truncate
         )
 
-        # Construct String Table
-        for sublist in table:
-            chart = "{chart}{lborder}{row}{rborder}\n".format(
-                chart=chart,
-                lborder=self.delims["vertical"][1:],
-                row=t_row.format(*sublist),
-                rborder=self.delims["vertical"][:-1],
-            )
+    def render(self, table: Table) -> str:
+        """Render a table of rows or columns with the compiled layout.
+
+        :param table: matrix of data or mapping of columns to fill table with
+        :return str: table representation of headers/matrix
+        """
+        return self._render(Chart._columns(self.headers, table))
+
+    def render_to(self, fp: TextIO, rows: Table) -> None:
+        """Write a table to a file object with the compiled layout.
+
+        :param fp: text file object to write the table to
+        :param rows: iterable of rows or mapping of columns to fill table with
+        """
+        if isinstance(rows, Mapping) or _is_array(rows):
+            self._write(fp, [Chart._columns(self.headers, rows)])
         else:
-            chart = "{chart}{lborder}{row}{rborder}".format(
-                chart=chart,
-                lborder=self.delims["up_right"],
-                row=self.delims["up_horizontal"].join(t_border),
-                rborder=self.delims["up_left"],
-            )
-
-        return chart
+            self._write(fp, Chart._blocks(self.headers, rows))
+
+    def _render(self, columns: List[List[str]]) -> str:
+        return "\n".join([
+            self._head, *starmap(self._row, zip(*columns)), self._bottom
+        ])
+
+    def _write(self, fp: TextIO, blocks: Iterable[List[List[str]]]) -> None:
+        fp.write(self._head + "\n")
+        for columns in blocks:
+            rows = list(starmap(self._row, zip(*columns)))
+            if rows:
+                fp.write("\n".join(rows) + "\n")
+        fp.write(self._bottom + "\n")
+
+
+class ChartPager(object):
+    """Windowed view over a large table with widths computed once.
+
+    Column widths come from one pass over the whole table on first render
+    and are cached with the compiled layout, so every page lines up and
+    later windows only convert and format the rows they show. The table
+    must support len() and slicing; a new pager is needed if the table
+    changes.
+    """
+    __slots__ = ("headers", "table", "align", "page_size", "_compiled")
+
+    def __init__(
+        self,
+        headers: List[str],
+        table: Table,
+        align: str = "center",
+        page_size: int = 50,
+        widths: Optional[Sequence[int]] = None
+    ) -> None:
+        """Create a paginated view over a table.
+
+        :param headers: list of strings with headers for columns
+        :param table: sequence of rows, mapping of columns or NumPy array
+        :param align: alignment of strings inside cells
+        :param page_size: number of rows on every page
+        :param widths: fixed column widths, found from the whole table if None
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.headers, self.table = list(headers), table
+        self.align, self.page_size = align, page_size
+        self._compiled = None
+        if widths is not None:
+            self._compiled = CompiledChart(headers, widths, align)
+
+    def __len__(self) -> int:
+        """Return the number of rows in the table."""
+        if isinstance(self.table, Mapping):
+            return len(self.table[self.headers[0]]) if self.headers else 0
+        return len(self.table)
+
+    @property
+    def pages(self) -> int:
+        """Return the number of pages, an empty table still has one."""
+        return max(1, -(-len(self) // self.page_size))
+
+    @property
+    def compiled(self) -> CompiledChart:
+        """Return the layout of the table, scanning it on first access."""
+        if self._compiled is None:
+            size, step = len(self), Chart.block_size
+            widths = Chart._widths(self.headers, (
+                Chart._columns(self.headers, self._slice(start, start + step))
+                for start in range(0, size, step)
+            ))
+            self._compiled = CompiledChart(self.headers, widths, self.align)
+        return self._compiled
+
+    @property
+    def widths(self) -> List[int]:
+        return self.compiled.widths
+
+    def page(self, number: int) -> str:
+        """Render a single page of the table.
+
+        :param number: zero based page number, negative counts from the end
+        :return str: table representation of the rows on the page
+        """
+        pages = self.pages
+        if not -pages <= number < pages:
+            raise IndexError("page out of range")
+        start = (number % pages) * self.page_size
+        return self.window(start, start + self.page_size)
+
+    def window(self, start: int, stop: int) -> str:
+        """Render the rows [start, stop) of the table.
+
+        :param start: index of the first row, negative counts from the end
+        :param stop: index after the last row, clamped to the table
+        :return str: table representation of the rows in the window
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return self.compiled.render(self._slice(start, stop))
+
+    def _slice(self, start: int, stop: int) -> Table:
+        if isinstance(self.table, Mapping):
+            return {
+                header: self.table[header][start:stop]
+                for header in self.headers
+            }
+        return self.table[start:stop]
+
+
+class LiveChart(object):
+    """Editable table that emits minimal terminal output on refresh.
+
+    Rendered row strings are kept between refreshes and a row is only
+    formatted again when it is inserted or updated. Column widths never
+    shrink, and all rows are formatted again only when a wider cell
+    arrives. diff() compares the new lines with the lines last shown and
+    returns ANSI cursor movements that rewrite only the lines that differ.
+    """
+    __slots__ = (
+        "headers", "align", "_widths", "_head", "_row", "_bottom",
+        "_cells", "_lines", "_screen",
+    )
+
+    def __init__(
+        self,
+        headers: List[str],
+        rows: Iterable[Sequence[Any]] = (),
+        align: str = "center"
+    ) -> None:
+        """Create a live table.
+
+        :param headers: list of strings with headers for columns
+        :param rows: initial rows of the table
+        :param align: alignment of strings inside cells
+        """
+        self.headers, self.align = list(headers), align
+        self._widths = [len(header) for header in self.headers]
+        self._cells, self._lines, self._screen = [], [], None
+        self._compile()
+        for row in rows:
+            self.append(row)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __getitem__(self, index: int) -> Tuple[str, ...]:
+        """Return the cell strings of a row."""
+        return self._cells[index]
+
+    def __setitem__(self, index: int, row: Sequence[Any]) -> None:
+        self.update(index, row)
+
+    def __delitem__(self, index: int) -> None:
+        self.delete(index)
+
+    @property
+    def widths(self) -> List[int]:
+        return list(self._widths)
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Add a row to the end of the table."""
+        self.insert(len(self._cells), row)
+
+    def insert(self, index: int, row: Sequence[Any]) -> None:
+        """Add a row before index."""
+        cells = self._convert(row)
+        self._cells.insert(index, cells)
+        self._lines.insert(index, self._row(*cells))
+
+    def update(self, index: int, row: Sequence[Any]) -> None:
+        """Replace the row at index, skipping rows that did not change."""
+        cells = self._convert(row)
+        if cells != self._cells[index]:
+            self._cells[index] = cells
+            self._lines[index] = self._row(*cells)
+
+    def delete(self, index: int) -> None:
+        """Remove the row at index."""
+        del self._cells[index]
+        del self._lines[index]
+
+    def render(self) -> str:
+        """Return the whole table as a string."""
+        return "\n".join(self._frame())
+
+    def diff(self, full: bool = False) -> str:
+        """Return the terminal output bringing the last shown table up to date.
+
+        The cursor is expected on the line below the table, where the
+        previous output left it, and is left there again.
+
+        :param full: write every line, e.g. after the screen was cleared
+        :return str: text and ANSI escape sequences to write to the terminal
+        """
+        lines, screen = self._frame(), self._screen
+        self._screen = lines
+        if screen is None or full:
+            return "\n".join(lines) + "\n"
+
+        # Rewrite Differing Lines Already on Screen, Top to Bottom
+        output, cursor, shown = [], len(screen), min(len(lines), len(screen))
+        for i in range(shown):
+            if lines[i] != screen[i]:
+                output.append(_move(cursor, i) + "\r" + lines[i] + "\x1b[K")
+                cursor = i
+
+        # Add Lines Below the Old Table or Clear the Leftover Lines
+        output.append(_move(cursor, shown) + "\r")
+        if len(lines) > len(screen):
+            output.append("\n".join(lines[shown:]) + "\n")
+        elif len(lines) < len(screen):
+            output.append("\x1b[J")
+
+        text = "".join(output)
+        return "" if text == "\r" else text
+
+    def refresh(self, fp: TextIO) -> int:
+        """Write the changes since the last refresh to a terminal.
+
+        :param fp: text file object of the terminal
+        :return int: number of characters written
+        """
+        text = self.diff()
+        if text:
+            fp.write(text)
+            fp.flush()
+        return len(text)
+
+    def _compile(self) -> None:
+        compiled = CompiledChart(self.headers, self._widths, self.align)
+        self._head = compiled._head.split("\n")
+        self._row, self._bottom = compiled._row, compiled._bottom
+
+    def _convert(self, row: Sequence[Any]) -> Tuple[str, ...]:
+        """Convert a row to strings, widening the columns if needed."""
+        if len(row) != len(self.headers):
+            raise Exception("headers do match the length of table items")
+        cells = tuple(map(str, row))
+
+        # Format Every Row Again Only When a Column Grows
+        widths = [
+            max(width, len(cell)) for width, cell in zip(self._widths, cells)
+        ]
+        if widths != self._widths:
+            self._widths = widths
+            self._compile()
+            self._lines = [self._row(*cells) for cells in self._cells]
+        return cells
+
+    def _frame(self) -> List[str]:
+        return [*self._head, *self._lines, self._bottom]
+
+
+def _move(row: int, target: int) -> str:
+    """Return the ANSI sequence moving the cursor between lines."""
+    if target < row:
+        return "\x1b[{0}A".format(row - target)
+    elif target > row:
+        return "\x1b[{0}B".format(target - row)
+    return ""
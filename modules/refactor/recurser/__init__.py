@@ -1,8 +1,55 @@
-from functools import partial, wraps
-from itertools import chain
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from os import cpu_count
 from sys import getdefaultencoding
-from types import SimpleNamespace
-from typing import Any, Dict, Tuple, Type, Union
+from types import (
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    FunctionType,
+    MethodDescriptorType,
+    SimpleNamespace,
+    WrapperDescriptorType,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    Union,
+)
+from .events import END_MAPPING, END_SEQUENCE, SCALAR, START_MAPPING, Event
+
+# Marker for Conversions Only Referenceable Once Finalized
+_CYCLE = object()
+
+# Marker for Names Missing from Class Dictionaries
+_MISSING = object()
+
+# Class Attributes Always Read as Callables from Instances
+_BOUND_CALLABLES = (
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    FunctionType,
+    MethodDescriptorType,
+    WrapperDescriptorType,
+    classmethod,
+    type,
+)
+
+# Bound on Memoized Key Conversions and Key Schemas
+SNAKED_CACHE_SIZE = 4096
+
+# Top Level Sequence Length Below Which Parallel Conversions Run Serially
+PARALLEL_THRESHOLD = 10000
+
+# Characters Followed by Uppercase Gain an Underscore, Uppercase is Lowered
+_SNAKE_BOUNDARY = re.compile(r"([^_])(?=[A-Z])|[A-Z]")
+
 
 class TypeHandler(type):
     __encoding = getdefaultencoding()
@@ -13,48 +60,106 @@ class TypeHandler(type):
     __builtin_set_types = (set, frozenset,)
     __builtin_text_sequence_types = (str,)
     __builtin_truth_types = (bool,)
-   
-    def merge(func):
-        """Merge lists of lists into single tuple"""
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            call = lambda x: tuple(chain(*x))
-            result = func(*args, **kwargs)
-            return call(([result], result)[isinstance(result, (list,))])
-        return wrapper
+
+    # Kinds in Fallback Resolution Order
+    __kinds = ("binary", "mapping", "iterable", "constant")
+
+    def __init__(
+        cls,
+        name: str,
+        bases: Tuple[Type],
+        namespace: Dict[str, Any],
+    ) -> None:
+        """Compute frozen type groups once, inheriting registrations"""
+        super().__init__(name, bases, namespace)
+        parents = [x for x in bases if isinstance(x, TypeHandler)]
+        if parents:
+            cls.__groups = dict(parents[0].__groups)
+        else:
+            cls.__groups = {
+                "binary": cls.__builtin_binary_sequence_types,
+                "constant": (
+                    cls.__builtin_numeric_types
+                    + cls.__builtin_text_sequence_types
+                    + cls.__builtin_truth_types
+                ),
+                "iterable": (
+                    cls.__builtin_sequence_types
+                    + cls.__builtin_set_types
+                ),
+                "mapping": cls.__builtin_mapping_types,
+            }
+        cls.__reset()
+
+    def __reset(cls) -> None:
+        """Rebuild the exact type lookup table from the type groups"""
+        cls.__lookup = {}
+        for kind in reversed(cls.__kinds):
+            cls.__lookup.update(dict.fromkeys(cls.__groups[kind], kind))
+
+    def register(cls, kind: str, *types: Type) -> None:
+        """Classify additional types as one of the conversion kinds
+
+        Types already in another group are moved to the given kind.
+
+        :param kind: one of binary, constant, iterable or mapping
+        :param types: types to be handled as the given kind
+        """
+        if kind not in cls.__kinds:
+            raise ValueError(
+                f"unknown kind {kind!r}, expected one of {cls.__kinds}"
+            )
+        # Move Types Out of Their Previous Groups so the New Kind Wins
+        groups = {
+            k: tuple(x for x in group if x not in types)
+            for k, group in cls.__groups.items()
+        }
+        groups[kind] += tuple(dict.fromkeys(types))
+        cls.__groups = groups
+        cls.__reset()
+
+    def classify(cls, t: Type) -> Union[str, None]:
+        """Return the conversion kind of a type, or None for unknown types
+
+        Exact types are resolved by lookup, subclasses are resolved once
+        through the type groups and cached.
+        """
+        try:
+            return cls.__lookup[t]
+        except KeyError:
+            kind = next(
+                (x for x in cls.__kinds if issubclass(t, cls.__groups[x])),
+                None,
+            )
+            cls.__lookup[t] = kind
+            return kind
 
     @property
-    @merge
-    def binary_types(self) -> Tuple[Type]:
+    def type_kinds(cls) -> Dict[Type, Union[str, None]]:
+        """Return the type to conversion kind lookup table (read only)"""
+        return cls.__lookup
+
+    @property
+    def binary_types(cls) -> Tuple[Type]:
         """Return all identified relevant standard library binary types"""
-        return self.builtin_binary_sequence_types
+        return cls.__groups["binary"]
 
     @property
-    @merge
-    def constant_types(self) -> Tuple[Type]:
-        """Return types which need no conversions within recursive transformation functions"""
-        return [
-            self.builtin_numeric_types,
-            self.builtin_text_sequence_types,
-            self.builtin_truth_types,
-        ]
+    def constant_types(cls) -> Tuple[Type]:
+        """Return types which need no conversions within
+        recursive transformation functions
+        """
+        return cls.__groups["constant"]
     
     @property
-    @merge
-    def iterable_types(self) -> Tuple[Type]:
+    def iterable_types(cls) -> Tuple[Type]:
         """Return all identified relevant standard library iterable types"""
-        return [
-            self.builtin_sequence_types,
-            self.builtin_set_types,
-        ]
+        return cls.__groups["iterable"]
     
     @property
-    @merge
-    def mapping_types(self) -> Tuple[Type]:
+    def mapping_types(cls) -> Tuple[Type]:
         """Return all identified relevant standard library mapping types"""
-        return [
-            self.builtin_mapping_types,
-        ]
+        return cls.__groups["mapping"]
 
     @property
     def encoding(cls) -> str:
@@ -103,127 +208,527 @@ class Recurser(metaclass=TypeHandler):
         val: Any, 
         convert_nonbuiltins: bool = False,
         nested_namespaces: bool = False,
+        namespace: Callable[[Dict[str, Any]], Any] = None,
+        share: bool = False,
+        workers: int = None,
+        executor: Executor = None,
         _counter: int = 0,
     ) -> Any:
         """Recursively change nested dictionary values to namespace
         
-        :param convert_nonbuiltins: convert nested objects outside of builtin objects
+        :param convert_nonbuiltins: convert nested objects outside of builtins
         :param nested_namespaces: convert nested dictionaries to namespaces
+        :param namespace: create namespaces from converted dictionaries,
+            such as FrozenNamespace.from_dict, defaults to SimpleNamespace
+        :param share: convert objects appearing several times once, reusing
+            the result
+        :param workers: convert large top level sequences in a process pool
+        :param executor: convert large top level sequences with an existing
+            executor
         :param _counter: internal variable for tracking iterations
         :return: SimpleNamespace converted representation of data structure
         """
+        if workers or executor:
+            return cls._rparallel(
+                cls.rnamespace,
+                val,
+                workers,
+                executor,
+                convert_nonbuiltins=convert_nonbuiltins,
+                nested_namespaces=nested_namespaces,
+                namespace=namespace,
+                share=share,
+            )
+
+        namespace = namespace or cls._namespace
+
         # Handle Non Standard Builtin Types
-        def unknown_handler():
-            condition = lambda t, x: not any([x.startswith("_"), callable(getattr(t, x))])
-            if not hasattr(val, "__dict__"):
-                return str(val)
-            elif (_counter == 0) or (convert_nonbuiltins and nested_namespaces):
-                return SimpleNamespace(**{
-                    x: rcall(getattr(val, x)) for x in dir(val) if condition(val, x)
-                })
+        def unknown_handler(obj: Any, top: bool) -> Tuple[Any, Any]:
+            if not hasattr(obj, "__dict__"):
+                return None, str(obj)
+            elif top or (convert_nonbuiltins and nested_namespaces):
+                return namespace, None
             elif convert_nonbuiltins and not nested_namespaces:
-                return {
-                    x: rcall(getattr(val, x)) for x in dir(val) if condition(val, x)
-                }
+                return dict, None
             else:
-                return val
+                return None, obj
 
-        # Handle Dictionaries
-        def dictionary_handler():
-            if nested_namespaces:
-                return SimpleNamespace(**{k: rcall(v) for k, v in val.items()})
-            else:
-                return {k: rcall(v) for k, v in val.items()}
-    
-        # Prepare Recursive Call
-        rcall = partial(
-            cls.rnamespace, 
-            convert_nonbuiltins=convert_nonbuiltins,
-            nested_namespaces=nested_namespaces,
-            _counter=(_counter+1),
+        return cls._rconvert(
+            val,
+            mapping=(dict, namespace)[nested_namespaces],
+            unknown=unknown_handler,
+            top=(_counter == 0),
+            share=share,
         )
 
-        # Handle Data Structures
-        if isinstance(val, cls.binary_types):
-            return str(val, cls.encoding)
-        elif isinstance(val, cls.mapping_types):
-            return dictionary_handler()
-        elif isinstance(val, cls.iterable_types):
-            return [rcall(x) for x in val]
-        elif isinstance(val, cls.constant_types):
-            return val
-        else:
-            return unknown_handler()
-
     @classmethod
     def rdict(
         cls,
         val: Any, 
         convert_nonbuiltins: bool = False, 
+        share: bool = False,
+        workers: int = None,
+        executor: Executor = None,
         _counter: int = 0,
     ) -> Any:
         """Recursively change nested objects to dictionary values
         
-        :param convert_nonbuiltins: convert nested objects outside of builtin objects
+        :param convert_nonbuiltins: convert nested objects outside of builtins
+        :param share: convert objects appearing several times once, reusing
+            the result
+        :param workers: convert large top level sequences in a process pool
+        :param executor: convert large top level sequences with an existing
+            executor
         :param _counter: internal variable for tracking iterations
         :return: dictionary converted representation of data structure
         """
+        if workers or executor:
+            return cls._rparallel(
+                cls.rdict,
+                val,
+                workers,
+                executor,
+                convert_nonbuiltins=convert_nonbuiltins,
+                share=share,
+            )
+
         # Handle Non Standard Builtin Types
-        def unknown_handler():
-            condition = lambda t, x: not any([x.startswith("_"), callable(getattr(t, x))])
-            if not hasattr(val, "__dict__"):
-                return str(val)
-            if _counter == 0 or convert_nonbuiltins:
-                return {x: rcall(getattr(val, x)) for x in dir(val) if condition(val, x)}
+        def unknown_handler(obj: Any, top: bool) -> Tuple[Any, Any]:
+            if not hasattr(obj, "__dict__"):
+                return None, str(obj)
+            if top or convert_nonbuiltins:
+                return dict, None
             else:
-                return val
+                return None, obj
 
-        # Prepare Recursive Call
-        rcall = partial(
-            cls.rdict, 
-            convert_nonbuiltins=convert_nonbuiltins,
-            _counter=(_counter+1),
+        return cls._rconvert(
+            val,
+            mapping=dict,
+            unknown=unknown_handler,
+            top=(_counter == 0),
+            share=share,
         )
-
-        # Handle Data Structures
-        if isinstance(val, cls.binary_types):
-            return str(val, cls.encoding)
-        elif isinstance(val, cls.mapping_types):
-            return {k: rcall(v) for k, v in val.items()}
-        elif isinstance(val, cls.iterable_types):
-            return [rcall(x) for x in val]
-        elif isinstance(val, cls.constant_types):
-            return val
-        else:
-            return unknown_handler()
    
     @classmethod
-    def rsnaked(cls, val: Any) -> Any:
+    def rsnaked(
+        cls,
+        val: Any,
+        share: bool = False,
+        workers: int = None,
+        executor: Executor = None,
+    ) -> Any:
         """Recursively change keys to snake case within data structure"""
-        if isinstance(val, cls.binary_types):
-            return str(val, cls.encoding)
-        elif isinstance(val, cls.mapping_types):
-            return {cls.snaked(k): cls.rsnaked(v) for k, v in val.items()}
-        elif isinstance(val, cls.iterable_types):
-            return [cls.rsnaked(x) for x in val]
-        elif isinstance(val, cls.constant_types):
-            return val
+        if workers or executor:
+            return cls._rparallel(
+                cls.rsnaked, val, workers, executor, share=share
+            )
+
+        return cls._rconvert(
+            val,
+            mapping=dict,
+            unknown=lambda obj, top: (None, None),
+            key=cls.snaked,
+            share=share,
+        )
         
+    @classmethod
+    def iter_rnamespace(
+        cls,
+        val: Iterable[Any],
+        convert_nonbuiltins: bool = False,
+        nested_namespaces: bool = False,
+        namespace: Callable[[Dict[str, Any]], Any] = None,
+    ) -> Iterator[Any]:
+        """Lazily yield rnamespace conversions of each top level item
+
+        :param val: iterable of items, including generators
+        :param convert_nonbuiltins: convert nested objects outside of builtins
+        :param nested_namespaces: convert nested dictionaries to namespaces
+        :param namespace: create namespaces from converted dictionaries
+        :return: generator of converted items, matching rnamespace(list(val))
+        """
+        for item in val:
+            yield cls.rnamespace(
+                item,
+                convert_nonbuiltins=convert_nonbuiltins,
+                nested_namespaces=nested_namespaces,
+                namespace=namespace,
+                _counter=1,
+            )
+
+    @classmethod
+    def iter_rdict(
+        cls,
+        val: Iterable[Any],
+        convert_nonbuiltins: bool = False,
+    ) -> Iterator[Any]:
+        """Lazily yield rdict conversions of each top level item
+
+        :param val: iterable of items, including generators
+        :param convert_nonbuiltins: convert nested objects outside of builtins
+        :return: generator of converted items, matching rdict(list(val))
+        """
+        for item in val:
+            yield cls.rdict(
+                item, convert_nonbuiltins=convert_nonbuiltins, _counter=1
+            )
+
+    @classmethod
+    def iter_rsnaked(cls, val: Iterable[Any]) -> Iterator[Any]:
+        """Lazily yield rsnaked conversions of each top level item
+
+        :param val: iterable of items, including generators
+        :return: generator of converted items, matching rsnaked(list(val))
+        """
+        for item in val:
+            yield cls.rsnaked(item)
+
+    @classmethod
+    def stream_rdict(cls, events: Iterable[Event]) -> Iterator[Event]:
+        """Change scalars to dictionary values within a document event stream
+
+        :param events: iterable of document events, see recurser.events
+        :return: generator of converted document events
+        """
+        return cls._rstream(
+            events, scalar=lambda x: cls.rdict(x, _counter=1), key=lambda x: x
+        )
+
+    @classmethod
+    def stream_rsnaked(cls, events: Iterable[Event]) -> Iterator[Event]:
+        """Change keys to snake case within a document event stream
+
+        :param events: iterable of document events, see recurser.events
+        :return: generator of converted document events
+        """
+        return cls._rstream(events, scalar=cls.rsnaked, key=cls.snaked)
+
+    @classmethod
+    def rsnaked_many(cls, records: Iterable[Any]) -> List[Any]:
+        """Change keys to snake case for an iterable of similar records
+
+        Key conversions are computed once per distinct key schema and reused
+        for every record sharing that schema.
+
+        :param records: iterable of records, typically dictionaries
+        :return: list of converted records
+        """
+        schemas, results = {}, []
+        for record in records:
+            if cls.classify(type(record)) != "mapping":
+                results.append(cls.rsnaked(record))
+                continue
+
+            # Convert Key Schema Once
+            keys = tuple(record)
+            names = schemas.get(keys)
+            if names is None:
+                if len(schemas) >= SNAKED_CACHE_SIZE:
+                    schemas.clear()
+                names = schemas[keys] = tuple(map(cls.snaked, keys))
+
+            values = cls.rsnaked(list(record.values()))
+            results.append(dict(zip(names, values)))
+
+        return results
+
     @classmethod
     def snaked(cls, val: str) -> str:
         """Convert a string to snake case"""
-        if len(val) <= 1:
-            return val.lower()
-        
-        snake = []
-        for i in range(len(val) - 1):
-            if val[i] != "_" and val[i+1].isupper():
-                snake.extend((val[i], "_"))
-            elif val[i].isupper():
-                snake.append(val[i].lower())
+        return _snaked(val)
+
+    @classmethod
+    def _rconvert(
+        cls,
+        val: Any,
+        mapping: Callable[[Dict], Any],
+        unknown: Callable[[Any, bool], Tuple[Any, Any]],
+        key: Callable[[Any], Any] = None,
+        top: bool = True,
+        share: bool = False,
+    ) -> Any:
+        """Convert a data structure with an explicit stack, not recursion
+
+        Containers are expanded into frames of (output, children, is mapping,
+        finalizer, parent key, source), so nesting depth is bounded by memory
+        rather than by the interpreter recursion limit. A container reached
+        again while it is still being converted is a cycle, which is output as
+        a reference to the partial result, or raises ValueError when the
+        result only exists once finalized (namespaces).
+
+        :param val: data structure to convert
+        :param mapping: finalizer applied to every converted mapping
+        :param unknown: callable returning (finalizer, None) to expand an
+            object's attributes or (None, value) to use value as the
+            converted result
+        :param key: optional transformation applied to mapping keys
+        :param top: treat val as the top level object of the conversion
+        :param share: convert each container once, reusing the result wherever
+            the same object appears again
+        :return: converted representation of data structure
+        """
+        encoding = cls.encoding
+        kinds = cls.type_kinds
+
+        # Conversions in Progress and Finished Conversions Keyed by id()
+        active, memo = {}, {}
+
+        # Frame Layout:
+        # [output, children, is_mapping, finalizer, parent_key, source]
+        stack = [[[], iter((val,)), False, None, None, None]]
+
+        while stack:
+            frame = stack[-1]
+            output, children, is_mapping = frame[0], frame[1], frame[2]
+            for child in children:
+                if is_mapping:
+                    name, child = child
+                    if key is not None:
+                        name = key(name)
+                else:
+                    name = None
+
+                # Handle Leaf Values
+                kind = kinds.get(type(child), False)
+                if kind is False:
+                    kind = cls.classify(type(child))
+
+                if kind == "constant":
+                    result = child
+                elif kind == "binary":
+                    result = str(child, encoding)
+                elif kind is None:
+                    finalizer, result = unknown(child, top and len(stack) == 1)
+                else:
+                    finalizer = mapping if kind == "mapping" else None
+
+                # Handle Data Structures, Reusing Active or Shared Conversions
+                if kind == "mapping" or kind == "iterable" or (
+                    kind is None and finalizer is not None
+                ):
+                    ident = id(child)
+                    if ident in active:
+                        result = active[ident]
+                        if result is _CYCLE:
+                            raise ValueError(
+                                "circular reference to "
+                                f"{type(child).__name__} object "
+                                "cannot be converted to a namespace"
+                            )
+                    elif share and ident in memo:
+                        result = memo[ident][1]
+                    else:
+                        if kind == "mapping":
+                            nested = [
+                                {}, iter(child.items()), True,
+                                finalizer, name, child,
+                            ]
+                        elif kind == "iterable":
+                            nested = [
+                                [], iter(child), False, None, name, child
+                            ]
+                        else:
+                            nested = [
+                                {}, cls._attributes(child), True,
+                                finalizer, name, child,
+                            ]
+                        final = finalizer is None or finalizer is dict
+                        active[ident] = nested[0] if final else _CYCLE
+                        stack.append(nested)
+                        break
+
+                if is_mapping:
+                    output[name] = result
+                else:
+                    output.append(result)
+            else:
+                # Finalize Exhausted Frame and Attach to Parent
+                stack.pop()
+                if not stack:
+                    return output[0]
+                if frame[3] is not None and frame[3] is not dict:
+                    output = frame[3](output)
+
+                ident = id(frame[5])
+                del active[ident]
+                if share:
+                    memo[ident] = (frame[5], output)
+
+                parent = stack[-1]
+                if parent[2]:
+                    parent[0][frame[4]] = output
+                else:
+                    parent[0].append(output)
+
+    @classmethod
+    def _rparallel(
+        cls,
+        method: Callable[..., Any],
+        val: Any,
+        workers: Union[int, None],
+        executor: Union[Executor, None],
+        **options: Any,
+    ) -> Any:
+        """Convert a large top level sequence in ordered chunks on an executor
+
+        Sequences shorter than PARALLEL_THRESHOLD, and any other value, are
+        converted serially. Objects appearing several times are only shared
+        within a chunk, and types registered after worker processes start
+        are not seen by them.
+
+        :param method: conversion classmethod applied to every chunk
+        :param val: data structure to convert
+        :param workers: number of worker processes when no executor is given
+        :param executor: executor used to convert chunks, left running
+        :param options: keyword arguments passed on to method
+        :return: converted representation of data structure
+        """
+        if type(val) not in (list, tuple) or len(val) < PARALLEL_THRESHOLD:
+            return method(val, **options)
+
+        # Split Into Several Chunks per Worker to Balance Uneven Records
+        count = workers or cpu_count() or 1
+        size = -(-len(val) // (count * 4))
+        chunks = [val[i:i + size] for i in range(0, len(val), size)]
+        convert = partial(_convert_chunk, method, options)
+
+        if executor is not None:
+            return [
+                x for chunk in executor.map(convert, chunks) for x in chunk
+            ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [x for chunk in pool.map(convert, chunks) for x in chunk]
+
+    @staticmethod
+    def _rstream(
+        events: Iterable[Event],
+        scalar: Callable[[Any], Any],
+        key: Callable[[Any], Any] = None,
+    ) -> Iterator[Event]:
+        """Transform scalar and mapping key events of a document event stream
+
+        :param events: iterable of document events
+        :param scalar: transformation applied to scalar values
+        :param key: optional transformation applied to mapping keys
+        :return: generator of transformed document events
+        """
+        # Stack Layout: [is_mapping, values_seen]
+        stack = []
+        for name, value in events:
+            if name in (END_MAPPING, END_SEQUENCE):
+                stack.pop()
+                yield name, value
+                continue
+
+            # Mapping Keys are Every Other Value
+            is_key = False
+            if stack:
+                parent = stack[-1]
+                is_key = parent[0] and not parent[1] % 2
+                parent[1] += 1
+
+            if name == SCALAR:
+                convert = key if is_key and key is not None else scalar
+                yield name, convert(value)
             else:
-                snake.append(val[i])
+                stack.append([name == START_MAPPING, 0])
+                yield name, value
+
+    @staticmethod
+    def _attributes(val: Any) -> Iterator[Tuple[str, Any]]:
+        """Yield public non callable attributes of an object
+
+        Attribute names are planned once per class and instance attribute
+        names, so homogeneous objects cost one read per field.
+        """
+        if type(val).__dir__ is not object.__dir__:
+            plan = [(x, False) for x in dir(val) if not x.startswith("_")]
         else:
-            snake.append(val[i+1].lower())
-            
-        return "".join(snake)
+            attrs = val.__dict__
+            plan = _attribute_plan(type(val), tuple(attrs))
+
+        for name, from_dict in plan:
+            attr = attrs[name] if from_dict else getattr(val, name)
+            if not callable(attr):
+                yield name, attr
+
+    @staticmethod
+    def _namespace(val: Dict[str, Any]) -> SimpleNamespace:
+        """Create a namespace from a converted mapping"""
+        return SimpleNamespace(**val)
+
+
+@lru_cache(maxsize=SNAKED_CACHE_SIZE)
+def _snaked(val: str) -> str:
+    """Convert a string to snake case, memoizing recent conversions"""
+    if type(val) is str and val.isascii():
+        return _SNAKE_BOUNDARY.sub(_snake_boundary, val)
+
+    # Fall Back to Unicode Aware Conversion
+    if len(val) <= 1:
+        return val.lower()
+
+    snake = []
+    for i in range(len(val) - 1):
+        if val[i] != "_" and val[i+1].isupper():
+            snake.extend((val[i], "_"))
+        elif val[i].isupper():
+            snake.append(val[i].lower())
+        else:
+            snake.append(val[i])
+    else:
+        snake.append(val[i+1].lower())
+
+    return "".join(snake)
+
+
+def _snake_boundary(match: re.Match) -> str:
+    """Replace a snake case boundary match"""
+    char = match.group(1)
+    return match.group().lower() if char is None else f"{char}_"
+
+
+def _convert_chunk(
+    method: Callable[..., Any],
+    options: Dict[str, Any],
+    chunk: List[Any],
+) -> List[Any]:
+    """Convert a chunk of a top level sequence inside a worker"""
+    return method(chunk, **options)
+
+
+@lru_cache(maxsize=SNAKED_CACHE_SIZE)
+def _attribute_plan(
+    cls: Type,
+    names: Tuple[str, ...]
+) -> Tuple[Tuple[str, bool], ...]:
+    """Plan attribute reads matching dir() order for a class and instance keys
+
+    Class attributes that always bind to callables are skipped, instance
+    dict entries are read directly unless a data descriptor on the class
+    shadows them.
+
+    :param cls: class of the object
+    :param names: instance attribute names of the object
+    :return: tuple of (name, read from instance dict) pairs
+    """
+    instance = set(names)
+    plan = []
+    for name in sorted(instance.union(dir(cls))):
+        if name.startswith("_"):
+            continue
+
+        # Find Raw Class Attribute Through the MRO
+        raw = next(
+            (x.__dict__[name] for x in cls.__mro__ if name in x.__dict__),
+            _MISSING,
+        )
+        descriptor = type(raw)
+        if name in instance and not (
+            hasattr(descriptor, "__set__") or hasattr(descriptor, "__delete__")
+        ):
+            plan.append((name, True))
+        elif not isinstance(raw, _BOUND_CALLABLES):
+            plan.append((name, False))
+
+    return tuple(plan)
@@ -0,0 +1,306 @@
+"""Incremental document events for streaming Recurser conversions
+
+Events are (name, value) tuples, where name is one of start_mapping,
+end_mapping, start_sequence, end_sequence or scalar. Mapping contents are
+emitted as alternating key and value events, mirroring the YAML event model,
+so documents can be transformed without materializing them.
+"""
+import json
+import re
+from typing import Any, Iterable, Iterator, TextIO, Tuple
+
+Event = Tuple[str, Any]
+
+START_MAPPING = "start_mapping"
+END_MAPPING = "end_mapping"
+START_SEQUENCE = "start_sequence"
+END_SEQUENCE = "end_sequence"
+SCALAR = "scalar"
+
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+_LITERALS = {"true": True, "false": False, "null": None}
+_NUMERIC = "+-.0123456789eE"
+_CLOSERS = {"}": "{", "]": "["}
+_WHITESPACE = " \t\n\r"
+_STRING_BODY = re.compile(r'(?:[^"\\]+|\\.)*', re.DOTALL)
+
+
+def json_events(fp: TextIO, chunk_size: int = 65536) -> Iterator[Event]:
+    """Incrementally parse a JSON document from a text file object
+
+    :param fp: text file object containing a single JSON document
+    :param chunk_size: number of characters read from fp at a time
+    :return: generator of document events
+    """
+    buf, pos, eof = "", 0, False
+    base = 0  # Document Offset of Buffer Start
+
+    # Open Containers and Next Expected Token
+    stack, expect = [], "value"
+
+    while True:
+        # Refill Buffer Once Exhausted
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(buf):
+            if eof:
+                break
+            chunk = fp.read(chunk_size)
+            base += len(buf)
+            buf, pos, eof = chunk, 0, not chunk
+            continue
+
+        char = buf[pos]
+
+        # Handle Separators and Closing Characters
+        if char == "," and expect == "separator":
+            expect = "key" if stack[-1] == "{" else "value"
+            pos += 1
+            continue
+        elif char == ":" and expect == "colon":
+            expect = "value"
+            pos += 1
+            continue
+        elif char in _CLOSERS and stack and stack[-1] == _CLOSERS[char] and (
+            expect in ("separator", "value_or_close", "key_or_close")
+        ):
+            stack.pop()
+            yield (END_MAPPING if char == "}" else END_SEQUENCE, None)
+            expect = "separator" if stack else "end"
+            pos += 1
+            continue
+        elif not (
+            expect in ("value", "value_or_close")
+            or (char == '"' and expect in ("key", "key_or_close"))
+        ):
+            raise ValueError(f"unexpected {char!r} at offset {base + pos}")
+
+        # Handle Containers
+        if char in "{[":
+            stack.append(char)
+            yield (START_MAPPING if char == "{" else START_SEQUENCE, None)
+            expect = "key_or_close" if char == "{" else "value_or_close"
+            pos += 1
+            continue
+
+        # Handle Scalars, Reading More When Token Reaches End of Buffer
+        try:
+            if char == '"':
+                try:
+                    value, end = json.decoder.scanstring(buf, pos + 1)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    base += pos
+                    buf, eof = _buffer_string(fp, buf[pos:], chunk_size)
+                    pos = 0
+                    value, end = json.decoder.scanstring(buf, 1)
+            elif char == "-" or char.isdigit():
+                match = _NUMBER.match(buf, pos)
+                end = pos if match is None else match.end()
+                if (
+                    not eof
+                    and len(buf) - end <= 2
+                    and not buf[end:].lstrip(_NUMERIC)
+                ):
+                    raise EOFError
+                if match is None:
+                    raise ValueError(
+                        f"invalid number at offset {base + pos}"
+                    )
+                number = match.group()
+                value = float(number) if any(match.groups()) else int(number)
+            else:
+                end = pos + next(
+                    (len(x) for x in _LITERALS if buf.startswith(x, pos)), 0
+                )
+                if end == pos and not eof and len(buf) - pos < 5:
+                    raise EOFError
+                if end == pos:
+                    raise ValueError(
+                        f"unexpected {char!r} at offset {base + pos}"
+                    )
+                value = _LITERALS[buf[pos:end]]
+        except (EOFError, json.JSONDecodeError):
+            if eof:
+                raise
+            chunk = fp.read(chunk_size)
+            base += pos
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            continue
+
+        yield (SCALAR, value)
+        pos = end
+        if expect in ("key", "key_or_close"):
+            expect = "colon"
+        else:
+            expect = "separator" if stack else "end"
+
+    if stack or expect != "end":
+        raise ValueError("unexpected end of JSON document")
+
+
+def _buffer_string(
+    fp: TextIO,
+    buf: str,
+    chunk_size: int
+) -> Tuple[str, bool]:
+    """Read until the string token at the start of buf is closed
+
+    Every chunk is scanned once for an unescaped quote and the chunks are
+    joined once, so long strings spanning many chunks cost linear time.
+
+    :param fp: text file object the document is read from
+    :param buf: buffer starting with the opening quote of the string
+    :param chunk_size: number of characters read from fp at a time
+    :return: buffer holding the whole string token, and whether fp is done
+    """
+    parts, size = [buf], len(buf)
+    quote, scan = _string_end(buf, 1)
+    while quote < 0:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            return "".join(parts), True
+
+        # Carry a Trailing Backslash so It Still Escapes the Next Character
+        tail = parts[-1][scan - size:] if scan < size else ""
+        parts.append(chunk)
+        quote, scan = _string_end(tail + chunk, 0)
+        scan += size - len(tail)
+        size += len(chunk)
+    return "".join(parts), False
+
+
+def _string_end(buf: str, pos: int) -> Tuple[int, int]:
+    """Find the closing quote of a string token from inside the token
+
+    :param buf: buffer holding the string token
+    :param pos: offset within the token to scan from
+    :return: offset of the closing quote or -1, and offset to resume from
+    """
+    pos = _STRING_BODY.match(buf, pos).end()
+    if pos < len(buf) and buf[pos] == '"':
+        return pos, pos
+    return -1, pos
+
+
+def yaml_events(stream: Any) -> Iterator[Event]:
+    """Incrementally parse a YAML document with the PyYAML safe loader
+
+    Scalars are resolved to python values with the same rules as
+    yaml.safe_load. Aliases are not supported since they would require
+    keeping every anchored node in memory.
+
+    :param stream: string or file object containing YAML
+    :return: generator of document events
+    """
+    import yaml
+    from yaml import events, nodes
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)(stream)
+    try:
+        while loader.check_event():
+            event = loader.get_event()
+            if isinstance(event, events.MappingStartEvent):
+                yield (START_MAPPING, None)
+            elif isinstance(event, events.MappingEndEvent):
+                yield (END_MAPPING, None)
+            elif isinstance(event, events.SequenceStartEvent):
+                yield (START_SEQUENCE, None)
+            elif isinstance(event, events.SequenceEndEvent):
+                yield (END_SEQUENCE, None)
+            elif isinstance(event, events.ScalarEvent):
+                tag = event.tag
+                if tag is None or tag == "!":
+                    tag = loader.resolve(
+                        nodes.ScalarNode, event.value, event.implicit
+                    )
+                node = nodes.ScalarNode(
+                    tag,
+                    event.value,
+                    event.start_mark,
+                    event.end_mark,
+                    event.style,
+                )
+                yield (SCALAR, loader.construct_object(node))
+                loader.constructed_objects.pop(node, None)
+            elif isinstance(event, events.AliasEvent):
+                raise ValueError(
+                    "yaml aliases are not supported when streaming"
+                )
+    finally:
+        loader.dispose()
+
+
+def build(events: Iterable[Event]) -> Any:
+    """Materialize the first value described by an event stream
+
+    :param events: iterable of document events
+    :return: dictionaries, lists and scalars described by the events
+    """
+    # Stack Layout: [container, pending_key, is_mapping, expecting_key]
+    stack = []
+    for name, value in events:
+        if name == START_MAPPING:
+            stack.append([{}, None, True, True])
+            continue
+        elif name == START_SEQUENCE:
+            stack.append([[], None, False, False])
+            continue
+        elif name in (END_MAPPING, END_SEQUENCE):
+            value = stack.pop()[0]
+        elif name != SCALAR:
+            raise ValueError(f"unknown event {name!r}")
+
+        # Attach Completed Value to Parent
+        if not stack:
+            return value
+        parent = stack[-1]
+        if not parent[2]:
+            parent[0].append(value)
+        elif parent[3]:
+            parent[1], parent[3] = value, False
+        else:
+            parent[0][parent[1]], parent[3] = value, True
+
+    raise ValueError("event stream ended before a complete value")
+
+
+def dump_json(events: Iterable[Event], fp: TextIO) -> None:
+    """Write an event stream to a text file object as JSON
+
+    :param events: iterable of document events
+    :param fp: text file object to write to
+    """
+    write = fp.write
+
+    # Stack Layout: [is_mapping, items_written]
+    stack = []
+    for name, value in events:
+        if name in (END_MAPPING, END_SEQUENCE):
+            stack.pop()
+            write("}" if name == END_MAPPING else "]")
+            continue
+
+        # Write Separators Before Keys and Values
+        if stack:
+            parent = stack[-1]
+            if parent[0] and parent[1] % 2:
+                write(": ")
+            elif parent[1]:
+                write(", ")
+            is_key = parent[0] and not parent[1] % 2
+            parent[1] += 1
+        else:
+            is_key = False
+
+        if name == START_MAPPING:
+            stack.append([True, 0])
+            write("{")
+        elif name == START_SEQUENCE:
+            stack.append([False, 0])
+            write("[")
+        elif is_key and not isinstance(value, str):
+            write(json.dumps(json.dumps(value)))
+        else:
+            write(json.dumps(value))
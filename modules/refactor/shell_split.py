@@ -1,85 +1,333 @@
-def shell_split(string, braces=False, brackets=False, parentheses=False):
-    """Splits String in UNIX Style Manner
-    """
-    from string import whitespace
-    def contains_whitespace(string):
-        for char in string:
-            if char in whitespace:
-                return True
-        return False
-    
-    #Tracking Variables
-    opener  = []    #Track Defined Open Characters
-    parts   = []    #Track Parts of Input String
-    tracked = ""    #Track Current String
-    counter = 0     #Track Iterations
-
-    #Open/Release Character Map
-    release = {
-        "\"": "\"",
-        "'": "'"
-    }
-
-    #Update With Extra Openers (Braces/Brackets/Parentheses)
-    if braces == True:
-        tmp = {"{": "}"}
-        release.update(tmp)
-    if brackets == True:
-        tmp = {"[": "]"}
-        release.update(tmp)
-    if parentheses == True:
-        tmp = {"(": ")"}
-        release.update(tmp)
-
-    while counter <= len(string):
-        #On Last Iteration
-        if counter == len(string):
-            #Prepend Unclosed Char to Tracked if 'opener' has Items
-            if len(opener) > 0:
-                unclosed_char = opener.pop()
-                tracked = unclosed_char + tracked
-
-            #Append to String Parts
-            if len(tracked) > 0:
-                parts.append(tracked)
-            break
-        else:
-            #Get Character and Increment Counter
-            char = string[counter]
-            counter += 1
-
-        #On All Iters Except Last
-        if len(opener) > 0:
-            #Release String if Current Chacter is a Close Character
-            if char == release[opener[0]]:
-                parts.append(tracked)
-                opener.pop()
-                tracked = ""
-            else:
-                #Append Character to 'tracked'
-                tracked = tracked + char
-        elif char in release.keys():
-            #If Char is an Open Character, Append Open Char to 'opener'
-            opener.append(char)
-
-            #Reset 'tracked'
-            tracked = ""
-        elif char.isspace():
-            #If Whitespace in String
-            if contains_whitespace(tracked) != True:
-                has_no_space = True
-            else:
-                has_no_space = False
-
-            #If String is Empty
-            is_not_empty = True if len(tracked) > 0 else False
-
-            #Append If Previous Chars are not Whitespace 
-            if all([has_no_space, is_not_empty]):
-                parts.append(tracked)
-                tracked = ""
-        else:
-            #Append Character to 'tracked'
-            tracked = tracked + char
-
-    return parts
+import re
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from os import cpu_count
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+# Characters Opening a Group Mapped to the Character Closing it
+QUOTES = {"\"": "\"", "'": "'"}
+EXTRA_OPENERS = (("{", "}"), ("[", "]"), ("(", ")"))
+
+# Size of the Blocks Read Backwards When Skipping Trailing Whitespace
+TAIL_BLOCK_SIZE = 65536
+
+
+@lru_cache(maxsize=None)
+def _scanner(
+    braces: bool = False,
+    brackets: bool = False,
+    parentheses: bool = False
+) -> Tuple[Dict[str, str], Pattern, Pattern]:
+    """Compile the opener map and word patterns for a set of openers.
+
+    The first pattern skips leading whitespace and captures the following
+    run of characters that are neither whitespace nor openers, the second
+    only matches such a run.
+    """
+    release = dict(QUOTES)
+    enabled_openers = zip((braces, brackets, parentheses), EXTRA_OPENERS)
+    for enabled, (opener, closer) in enabled_openers:
+        if enabled:
+            release[opener] = closer
+    rest = r"[^\s{0}]*".format(re.escape("".join(release)))
+    return release, re.compile(r"\s*({0})".format(rest)), re.compile(rest)
+
+
+@lru_cache(maxsize=None)
+def _span_scanner(
+    braces: bool = False,
+    brackets: bool = False,
+    parentheses: bool = False,
+    binary: bool = False
+) -> Tuple[Pattern, Tuple[int, ...]]:
+    """Compile a pattern matching one whole token per match.
+
+    Every alternative has a single capture group spanning the token text,
+    the returned codes map each group index to the opener it reports.
+    """
+    release = _scanner(braces, brackets, parentheses)[0]
+    word = r"[^\s{0}]".format(re.escape("".join(release)))
+
+    # Closed Groups Report Their Opener, Unclosed Groups Keep it as Text
+    groups, codes = [], [0]
+    for opener, closer in release.items():
+        groups.append(r"{0}([^{1}]*){1}|({0}.*)".format(
+            re.escape(opener), re.escape(closer)
+        ))
+        codes.extend((ord(opener), 0))
+    pattern = r"\s*(?:{0}*(?:{1})|({0}+))".format(word, "|".join(groups))
+    codes.append(0)
+
+    if binary:
+        return re.compile(pattern.encode("ascii"), re.DOTALL), tuple(codes)
+    return re.compile(pattern, re.DOTALL), tuple(codes)
+
+
+def shell_split(string, braces=False, brackets=False, parentheses=False):
+    """Splits String in UNIX Style Manner
+
+    Words are separated by whitespace, and quoted (or optionally braced,
+    bracketed or parenthesized) groups become a single token without their
+    delimiters. Groups do not nest, text directly before an opener is
+    dropped, and an unclosed group keeps its opener and runs to the end.
+    """
+    release, word, _ = _scanner(
+        braces == True, brackets == True, parentheses == True
+    )
+    return _split(string, release, word)
+
+
+def _split(string: str, release: Dict[str, str], word: Pattern) -> List[str]:
+    """Split a string with an already compiled opener configuration."""
+    match, find, size = word.match, string.find, len(string)
+
+    parts, pos = [], 0
+    while True:
+        start, end = match(string, pos).span(1)
+        if end == size:
+            # Append Trailing Word
+            if end > start:
+                parts.append(string[start:end])
+            return parts
+
+        char = string[end]
+        if char in release:
+            # Slice Group up to its Closer, Keeping the Opener if Unclosed
+            close = find(release[char], end + 1)
+            if close == -1:
+                parts.append(string[end:])
+                return parts
+            parts.append(string[end + 1:close])
+            pos = close + 1
+        else:
+            # Whitespace Ends the Current Word
+            parts.append(string[start:end])
+            pos = end
+
+
+def shell_split_many(
+    lines: Iterable[str],
+    braces: bool = False,
+    brackets: bool = False,
+    parentheses: bool = False,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> List[List[str]]:
+    """Split many independent strings, optionally in worker processes.
+
+    Without workers or an executor the strings are split in this process,
+    looking the opener configuration up once for the whole batch. Otherwise
+    the strings are sent in chunks to a process pool, where each worker
+    compiles the configuration once, and the results keep input order.
+
+    :param lines: iterable of strings to split
+    :param braces: group text between { and }
+    :param brackets: group text between [ and ]
+    :param parentheses: group text between ( and )
+    :param workers: number of worker processes when no executor is given
+    :param chunksize: strings per task, by default four tasks per worker
+    :param executor: executor used to split chunks, left running
+    :return: list of token lists in the order of lines
+    """
+    options = (braces == True, brackets == True, parentheses == True)
+    if not (workers or executor):
+        return _split_chunk(options, lines)
+
+    # Split Into Several Chunks per Worker to Balance Uneven Lines
+    lines = lines if isinstance(lines, (list, tuple)) else list(lines)
+    if chunksize is None:
+        chunks_wanted = (workers or cpu_count() or 1) * 4
+        chunksize = max(1, -(-len(lines) // chunks_wanted))
+    chunks = [lines[i:i + chunksize] for i in range(0, len(lines), chunksize)]
+    split = partial(_split_chunk, options)
+
+    if executor is not None:
+        return [
+            parts for chunk in executor.map(split, chunks) for parts in chunk
+        ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [parts for chunk in pool.map(split, chunks) for parts in chunk]
+
+
+def _split_chunk(
+    options: Tuple[bool, bool, bool],
+    lines: Iterable[str]
+) -> List[List[str]]:
+    """Split a chunk of strings with one lookup of the opener configuration."""
+    release, word, _ = _scanner(*options)
+    return [_split(line, release, word) for line in lines]
+
+
+def iter_shell_split(
+    stream: Union[TextIO, Iterable[str]],
+    braces: bool = False,
+    brackets: bool = False,
+    parentheses: bool = False,
+    lines: bool = False,
+    chunk_size: int = 65536
+) -> Iterator[Union[str, List[str]]]:
+    """Split a text stream in UNIX style manner, a chunk at a time.
+
+    Tokens match shell_split over the whole text, including groups and
+    words that span chunks. Iterables are treated as consecutive pieces of
+    one text, so lines must keep their line endings (as file iteration
+    does). With lines, a list of tokens is yielded for every logical line,
+    where newlines inside a group do not end the line.
+
+    :param stream: text file object or iterable of strings
+    :param braces: group text between { and }
+    :param brackets: group text between [ and ]
+    :param parentheses: group text between ( and )
+    :param lines: yield lists of tokens per logical line instead of tokens
+    :param chunk_size: number of characters read from file objects at a time
+    :return: generator of tokens, or of token lists with lines
+    """
+    if hasattr(stream, "read"):
+        stream = iter(partial(stream.read, chunk_size), "")
+    tokens = _stream_tokens(stream, *_scanner(
+        braces == True, brackets == True, parentheses == True
+    ))
+    if not lines:
+        yield from (token for token in tokens if token is not None)
+        return
+
+    line = []
+    for token in tokens:
+        if token is None:
+            yield line
+            line = []
+        else:
+            line.append(token)
+    if line:
+        yield line
+
+
+def _stream_tokens(
+    chunks: Iterable[str],
+    release: Dict[str, str],
+    word: Pattern,
+    rest: Pattern
+) -> Iterator[Optional[str]]:
+    """Yield tokens from text chunks, with None for newlines between tokens."""
+    chunks = iter(chunks)
+    buf, pos = "", 0
+    while True:
+        start, end = word.match(buf, pos).span(1)
+        for _ in range(buf.count("\n", pos, start)):
+            yield None
+
+        if end < len(buf):
+            token = buf[start:end]
+        else:
+            # Read More Text, Carrying Over a Word Cut at the Chunk Boundary
+            pieces = [buf[start:end]]
+            for buf in chunks:
+                end = rest.match(buf).end()
+                pieces.append(buf[:end])
+                if end < len(buf):
+                    break
+            else:
+                token = "".join(pieces)
+                if token:
+                    yield token
+                return
+            token = "".join(pieces)
+
+        char = buf[end]
+        if char not in release:
+            # Whitespace Ends the Current Word
+            if token:
+                yield token
+            pos = end
+            continue
+
+        # Collect Group up to its Closer, Dropping the Word Before it
+        closer = release[char]
+        close = buf.find(closer, end + 1)
+        if close != -1:
+            yield buf[end + 1:close]
+            pos = close + 1
+            continue
+
+        pieces = [buf[end + 1:]]
+        for buf in chunks:
+            close = buf.find(closer)
+            if close != -1:
+                pieces.append(buf[:close])
+                break
+            pieces.append(buf)
+        else:
+            yield char + "".join(pieces)
+            return
+        yield "".join(pieces)
+        pos = close + 1
+
+
+def shell_split_spans(
+    buf: Any,
+    braces: bool = False,
+    brackets: bool = False,
+    parentheses: bool = False
+) -> array:
+    """Find the offsets of the shell_split tokens without copying them.
+
+    The result is a flat array of (start, end, opener) triples, which can be
+    grouped with zip(*[iter(spans)] * 3). buf[start:end] is the token
+    shell_split returns. opener is the code point of the opener for closed
+    groups, and 0 for words and unclosed groups, whose span includes the
+    opener. Bytes-like buffers (bytes, memoryview, mmap) only treat ASCII
+    whitespace as separators.
+
+    :param buf: str or bytes-like object to scan
+    :param braces: group text between { and }
+    :param brackets: group text between [ and ]
+    :param parentheses: group text between ( and )
+    :return array: signed 64 bit (start, end, opener) triples
+    """
+    pattern, codes = _span_scanner(
+        braces == True,
+        brackets == True,
+        parentheses == True,
+        not isinstance(buf, str),
+    )
+    # Stop Before Trailing Whitespace, Which Every Alternative Would Retry
+    size, end = len(buf), _content_end(buf)
+    spans = array("q")
+    extend = spans.extend
+    group = None
+    for match in pattern.finditer(buf, 0, end):
+        group = match.lastindex
+        extend((*match.span(group), codes[group]))
+
+    # Unclosed Groups (Even Group Indices) Run to the End of the Buffer
+    if group is not None and not group % 2:
+        spans[-2] = size
+    return spans
+
+
+def _content_end(buf: Any) -> int:
+    """Find the end of the last non-whitespace character of a buffer."""
+    end = len(buf)
+    while end > 0:
+        start = max(0, end - TAIL_BLOCK_SIZE)
+        block = buf[start:end]
+        if not isinstance(block, (str, bytes)):
+            block = bytes(block)
+        stripped = len(block.rstrip())
+        if stripped:
+            return start + stripped
+        end = start
+    return 0
@@ -1,14 +1,32 @@
-from queue import LifoQueue
-from typing import Any, Generator, List, TypeVar
+from typing import (
+    Any, Callable, Generator, Iterator, List, Optional, TextIO, Tuple, TypeVar
+)
 
 Node = TypeVar("T", bound="Node")
 
+# Traversal Orders Mapped to the Generator Implementing Them
+_ORDERS = {
+    "pre": "_preorder",
+    "post": "_postorder",
+    "level": "_levelorder",
+    "leaves": "_preorder",
+}
+
+# Shared Pieces of Display Lines
+_BRANCH = "├─ "
+_LAST = "└─ "
+_PIPE = "│  "
+_BLANK = "   "
+
 
 class Node(object):
     __slots__ = [
         "__data",
         "__children",
         "__parent",
+        "__depth",
+        "__root",
+        "__index",
     ]
 
     def __init__(self, data: Any = None) -> None:
@@ -19,6 +37,9 @@ class Node(object):
         self.__data = data
         self.__children = []
         self.__parent = None
+        self.__depth = 0
+        self.__root = self
+        self.__index = None
 
     @property
     def data(self) -> Any:
@@ -42,12 +63,13 @@ class Node(object):
 
     @property
     def root(self) -> Node:
-        """Get top level node of tree."""
-        current = self
-        while current.parent is not None:
-            current = current.parent
+        """Get top level node of tree, maintained by add_child."""
+        return self.__root
 
-        return current
+    @property
+    def depth(self) -> int:
+        """Get number of edges to the root, maintained by add_child."""
+        return self.__depth
 
     @property
     def siblings(self) -> List[Node]:
@@ -59,76 +81,268 @@ class Node(object):
         return self.parent.children
 
     def add_child(self, obj: Any) -> None:
-        """Add children Nodes to current Nodes children list."""
+        """Add children Nodes to current Nodes children list.
+
+        A Node that already has a parent is moved, and the cached depth and
+        root of every node in the attached subtree are updated. Ancestor
+        indexes of both trees are invalidated.
+        """
         # Make Node if Object is Not Already a Node Instance
         if not isinstance(obj, Node):
             obj = Node(obj)
+        elif obj.__root is self.__root and (
+            obj is self or obj.is_ancestor(self)
+        ):
+            raise ValueError(
+                "cannot add a node as a child of its own descendant"
+            )
+
+        # Invalidate Indexes and Detach From Previous Parent
+        obj.__root.__index = self.__root.__index = None
+        if obj.__parent is not None:
+            obj.__parent.__children.remove(obj)
 
         # Track Parent/Child Relationship
         obj.__parent = self
         self.__children.append(obj)
 
-    def display(self, from_root: bool = False) -> str:
+        # Update Cached Depth and Root Through the Attached Subtree
+        delta, root = self.__depth + 1 - obj.__depth, self.__root
+        if not obj.__children:
+            obj.__depth, obj.__root = obj.__depth + delta, root
+        elif delta or obj.__root is not root:
+            for node in obj.traverse():
+                node.__depth, node.__root = node.__depth + delta, root
+
+    def build_index(self) -> "AncestorIndex":
+        """Build, or reuse, the ancestor index of the whole tree.
+
+        Once built, is_ancestor answers in O(1) and kth_ancestor and lca in
+        O(log n). The index is dropped whenever add_child changes the tree.
+
+        :return: ancestor index stored on the root
+        """
+        root = self.__root
+        if root.__index is None:
+            root.__index = AncestorIndex(root)
+        return root.__index
+
+    def is_ancestor(self, other: Node) -> bool:
+        """Check whether the node is a proper ancestor of another node.
+
+        :param other: node that may be a descendant
+        :return: bool true if other is below this node
+        """
+        if other.__root is not self.__root or other.__depth <= self.__depth:
+            return False
+        index = self.__root.__index
+        if index is not None:
+            return index.is_ancestor(self, other)
+        return other.kth_ancestor(other.__depth - self.__depth) is self
+
+    def kth_ancestor(self, k: int) -> Optional[Node]:
+        """Get the ancestor k levels up, the node itself for 0.
+
+        :param k: number of levels to walk up
+        :return: ancestor node or None if k is larger than the depth
+        """
+        if k < 0:
+            raise ValueError("k must not be negative")
+        if k > self.__depth:
+            return None
+        index = self.__root.__index
+        if index is not None:
+            return index.kth_ancestor(self, k)
+
+        node = self
+        for _ in range(k):
+            node = node.__parent
+        return node
+
+    def lca(self, other: Node) -> Optional[Node]:
+        """Get the lowest common ancestor of two nodes, which may be either.
+
+        :param other: node in the same tree
+        :return: deepest node above or equal to both, None across trees
+        """
+        if other.__root is not self.__root:
+            return None
+        index = self.__root.__index
+        if index is not None:
+            return index.lca(self, other)
+
+        # Walk Up to the Same Depth, Then Up Together
+        first = self.kth_ancestor(max(0, self.__depth - other.__depth))
+        second = other.kth_ancestor(max(0, other.__depth - self.__depth))
+        while first is not second:
+            first, second = first.__parent, second.__parent
+        return first
+
+    def display(
+        self,
+        from_root: bool = False,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None
+    ) -> str:
         """String representation of tree from either the current node or root.
 
         :param from_root: bool to start tree from root instead of current node
+        :param max_depth: deepest level shown, counted from the starting node
+        :param max_nodes: maximum number of nodes shown
         :return: string representation of tree
         """
+        return "\n".join(self.display_lines(from_root, max_depth, max_nodes))
 
-        def dive(
-            node: Node,
-            last: str = "",
-            prefix: str = "",
-            string: List[str] = []
-        ) -> str:
-            """Recursively traverse nodes and build tree.
-
-            :param node: Node object
-            :param last: tracks last special character called
-            :param prefix: string to track string nesting
-            :param string: list of string results from dive calls
-            :return: string representation of node tree
-            """
-            # Determine Leaf String
-            if len(prefix) == 0:
-                current = f"{prefix}└─ "
-            elif node.parent.children[-1] is not node:
-                current = f"{prefix}├─ "
-            elif last == "├":
-                current = f"{prefix}└─ "
-            else:
-                current = f"{''.join([prefix[:-3], (3 * ' ')])}└─ "
-
-            # Track Recurse Vars
-            last = current[-3]
-            prefix += f"│{2 * ' '}" if last == "├" else f"{3 * ' '}"
-            string.append("".join([current, str(node.data)]))
-
-            # Re-Call on Children
-            for child in node.children:
-                dive(child, last=last, prefix=prefix)
-
-            return "\n".join(string)
-
-        # Return Tree from Current Node or From Root
-        if from_root is True:
-            return dive(self.root)
-        else:
-            return dive(self)
+    def display_to(
+        self,
+        fp: TextIO,
+        from_root: bool = False,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None
+    ) -> None:
+        """Write the tree representation to a file object line by line.
 
-    def __iter__(self) -> Generator:
-        """Overloaded __iter__ method to traverse tree from current node."""
-        # Init Stack
-        stack = LifoQueue()
-        stack.put(self)
+        :param fp: text file object to write the tree to
+        :param from_root: bool to start tree from root instead of current node
+        :param max_depth: deepest level shown, counted from the starting node
+        :param max_nodes: maximum number of nodes shown
+        """
+        fp.writelines(
+            line + "\n"
+            for line in self.display_lines(from_root, max_depth, max_nodes)
+        )
+
+    def display_lines(
+        self,
+        from_root: bool = False,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None
+    ) -> Iterator[str]:
+        """Generate the tree representation lines with an explicit stack.
+
+        Nodes are visited depth first in child order. Each open level only
+        keeps one of the shared prefix pieces, so extra memory grows with the
+        depth of the tree, not its size or the length of its lines.
+
+        :param from_root: bool to start tree from root instead of current node
+        :param max_depth: deepest level shown, counted from the starting node
+        :param max_nodes: maximum number of nodes shown
+        :return: generator of lines without trailing newlines
+        """
+        start = self.root if from_root is True else self
+        if max_nodes == 0:
+            return
+        yield _LAST + str(start.data)
+
+        # Stack Layout: [children, next_index], With One Prefix Piece per Frame
+        stack = [[start.children, 0]] if max_depth != 0 else []
+        pieces = [_BLANK]
+        count = 1
+        while stack:
+            frame = stack[-1]
+            children, index = frame
+            if index == len(children):
+                stack.pop()
+                pieces.pop()
+                continue
+            frame[1] = index + 1
+
+            if count == max_nodes:
+                return
+            count += 1
+
+            # Determine Leaf String and Nesting of Grandchildren
+            child, last = children[index], index == len(children) - 1
+            pieces.append(_LAST if last else _BRANCH)
+            pieces.append(str(child.data))
+            yield "".join(pieces)
+            del pieces[-2:]
+            within = max_depth is None or len(stack) < max_depth
+            if child.children and within:
+                stack.append([child.children, 0])
+                pieces.append(_BLANK if last else _PIPE)
+
+    def traverse(
+        self,
+        order: str = "pre",
+        depths: bool = False,
+        skip: Callable[[Node], bool] = None,
+        until: Callable[[Node], bool] = None,
+    ) -> Generator:
+        """Traverse the tree from the current node with an explicit list stack.
+
+        Children are visited in the order they were added. Depths are counted
+        from the current node.
 
-        # Iter Through Children and Yield to Caller
-        while stack.qsize() > 0:
-            current = stack.get()
-            for child in current.children:
-                stack.put(child)
+        :param order: "pre", "post", "level" or "leaves"
+        :param depths: yield (depth, node) tuples instead of nodes
+        :param skip: leave out every node it is true for, with its subtree
+        :param until: stop after yielding the first node it is true for
+        :return: generator of nodes or (depth, node) tuples
+        """
+        if order not in _ORDERS:
+            raise ValueError(f"unknown traversal order {order!r}")
+        if skip is not None and skip(self):
+            return
+        traversal = getattr(self, _ORDERS[order])(skip)
+        if order == "leaves":
+            traversal = (x for x in traversal if not x[1].__children)
+
+        for depth, node in traversal:
+            yield (depth, node) if depths else node
+            if until is not None and until(node):
+                return
+
+    def _preorder(
+        self,
+        skip: Callable[[Node], bool]
+    ) -> Iterator[Tuple[int, Node]]:
+        """Yield (depth, node) parents first, one child iterator per level."""
+        yield 0, self
+        stack = [iter(self.__children)]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+            elif skip is None or not skip(node):
+                yield len(stack), node
+                if node.__children:
+                    stack.append(iter(node.__children))
+
+    def _postorder(
+        self,
+        skip: Callable[[Node], bool]
+    ) -> Iterator[Tuple[int, Node]]:
+        """Yield (depth, node) children first, once their iterator ends."""
+        stack = [(self, iter(self.__children))]
+        while stack:
+            node = next(stack[-1][1], None)
+            if node is None:
+                yield len(stack) - 1, stack.pop()[0]
+            elif skip is None or not skip(node):
+                stack.append((node, iter(node.__children)))
+
+    def _levelorder(
+        self,
+        skip: Callable[[Node], bool]
+    ) -> Iterator[Tuple[int, Node]]:
+        """Yield (depth, node) level by level."""
+        level, depth = [self], 0
+        while level:
+            following = []
+            for node in level:
+                if depth and skip is not None and skip(node):
+                    continue
+                yield depth, node
+                following.extend(node.__children)
+            level, depth = following, depth + 1
+
+    def __iter__(self) -> Generator:
+        """Overloaded __iter__ method to traverse tree from current node.
 
-            yield current
+        Nodes are yielded in pre-order, children in the order they were added.
+        """
+        return self.traverse()
 
     def __str__(self) -> str:
         """Overloaded __str__ method to print node data."""
@@ -137,3 +351,71 @@ class Node(object):
     def __repr__(self) -> str:
         """Overloaded __repr__ method with condensed info."""
         return f"<{self.__class__.__name__} {hex(id(self))}>"
+
+
+class AncestorIndex(object):
+    """Euler tour and binary lifting tables for one tree.
+
+    Nodes are numbered in pre-order, so a node's subtree is the contiguous
+    range [position, last], which answers ancestor checks in O(1). Rows of
+    jumps hold the 2 ** k-th ancestor of every position for O(log n)
+    kth_ancestor and lca queries.
+    """
+    __slots__ = ("nodes", "_position", "_last", "_jumps")
+
+    def __init__(self, root: Node) -> None:
+        """Build the index of the tree below root.
+
+        :param root: top level node of the tree
+        """
+        self.nodes = list(root.traverse())
+        self._position = position = {
+            node: i for i, node in enumerate(self.nodes)
+        }
+
+        # Parents as Positions, the Root Being its Own Parent
+        parents = [0] + [position[node.parent] for node in self.nodes[1:]]
+
+        # Last Position of Every Subtree, Filled From the Deepest Nodes Up
+        last = list(range(len(self.nodes)))
+        for i in range(len(self.nodes) - 1, 0, -1):
+            if last[i] > last[parents[i]]:
+                last[parents[i]] = last[i]
+        self._last = last
+
+        self._jumps = [parents]
+        while 1 << len(self._jumps) < len(self.nodes):
+            jump = self._jumps[-1]
+            self._jumps.append([jump[i] for i in jump])
+
+    def is_ancestor(self, node: Node, other: Node) -> bool:
+        """Check whether node is a proper ancestor of other."""
+        first, second = self._position[node], self._position[other]
+        return first < second <= self._last[first]
+
+    def kth_ancestor(self, node: Node, k: int) -> Optional[Node]:
+        """Get the ancestor of node k levels up, None above the root."""
+        if k > node.depth:
+            return None
+        i, bit = self._position[node], 0
+        while k:
+            if k & 1:
+                i = self._jumps[bit][i]
+            k, bit = k >> 1, bit + 1
+        return self.nodes[i]
+
+    def lca(self, node: Node, other: Node) -> Node:
+        """Get the lowest common ancestor of two nodes of the tree."""
+        first, second = self._position[node], self._position[other]
+        last = self._last
+        if first <= second <= last[first]:
+            return node
+        if second <= first <= last[second]:
+            return other
+
+        # Jump Up While Still Not Above Second
+        for jump in reversed(self._jumps):
+            up = jump[first]
+            if not up <= second <= last[up]:
+                first = up
+        return self.nodes[self._jumps[0][first]]
@@ -1,7 +1,5 @@
-from functools import wraps
-from itertools import chain
 from sys import getdefaultencoding
-from typing import Any, Callable, List, Tuple, Type
+from typing import Any, Dict, Tuple, Type, Union
 
 
 class TypeHandler(type):
@@ -14,72 +12,119 @@ class TypeHandler(type):
     __builtin_text_sequence_types = (str,)
     __builtin_truth_types = (bool,)
 
-    def merge(func) -> Callable:
-        """Merge lists of lists into single tuple."""
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any):
-            def chainer(x: List[Any]) -> List[Any]:
-                return tuple(chain(*x))
-            result = func(*args, **kwargs)
-            return chainer(([result], result)[isinstance(result, (list,))])
-        return wrapper
+    # Kinds in Fallback Resolution Order
+    __kinds = ("binary", "mapping", "iterable", "constant")
+
+    def __init__(
+        cls,
+        name: str,
+        bases: Tuple[Type],
+        namespace: Dict[str, Any],
+    ) -> None:
+        """Compute frozen type groups once, inheriting registrations."""
+        super().__init__(name, bases, namespace)
+        parents = [x for x in bases if isinstance(x, TypeHandler)]
+        if parents:
+            cls.__groups = dict(parents[0].__groups)
+        else:
+            cls.__groups = {
+                "binary": cls.__builtin_binary_sequence_types,
+                "constant": (
+                    cls.__builtin_numeric_types
+                    + cls.__builtin_text_sequence_types
+                    + cls.__builtin_truth_types
+                ),
+                "iterable": (
+                    cls.__builtin_sequence_types
+                    + cls.__builtin_set_types
+                ),
+                "mapping": cls.__builtin_mapping_types,
+            }
+        cls.__reset()
+
+    def __reset(cls) -> None:
+        """Rebuild the exact type lookup table from the type groups."""
+        cls.__lookup = {}
+        for kind in reversed(cls.__kinds):
+            cls.__lookup.update(dict.fromkeys(cls.__groups[kind], kind))
+
+    def register(cls, kind: str, *types: Type) -> None:
+        """Classify additional types as one of the conversion kinds.
+
+        Types already in another group are moved to the given kind.
+
+        :param kind: one of binary, constant, iterable or mapping
+        :param types: types to be handled as the given kind
+        """
+        if kind not in cls.__kinds:
+            raise ValueError(
+                f"unknown kind {kind!r}, expected one of {cls.__kinds}"
+            )
+        # Move Types Out of Their Previous Groups so the New Kind Wins
+        groups = {
+            k: tuple(x for x in group if x not in types)
+            for k, group in cls.__groups.items()
+        }
+        groups[kind] += tuple(dict.fromkeys(types))
+        cls.__groups = groups
+        cls.__reset()
+
+    def classify(cls, t: Type) -> Union[str, None]:
+        """Return the conversion kind of a type, or None for unknown types.
+
+        Exact types are resolved by lookup, subclasses are resolved once
+        through the type groups and cached.
+        """
+        try:
+            return cls.__lookup[t]
+        except KeyError:
+            kind = next(
+                (x for x in cls.__kinds if issubclass(t, cls.__groups[x])),
+                None,
+            )
+            cls.__lookup[t] = kind
+            return kind
 
     @property
-    @merge
     def binary_types(cls) -> Tuple[Type]:
         """Return all identified relevant standard library binary types."""
-        return [
-            cls.__builtin_binary_sequence_types,
-        ]
+        return cls.__groups["binary"]
 
     @property
-    @merge
     def constant_types(cls) -> Tuple[Type]:
         """Return types which need no conversions within
         recursive transformation functions.
         """
-        return [
-            cls.__builtin_numeric_types,
-            cls.__builtin_text_sequence_types,
-            cls.__builtin_truth_types,
-        ]
+        return cls.__groups["constant"]
 
     @property
-    @merge
     def iterable_types(cls) -> Tuple[Type]:
         """Return all identified relevant standard library iterable types."""
-        return [
-            cls.__builtin_sequence_types,
-            cls.__builtin_set_types,
-        ]
+        return cls.__groups["iterable"]
 
     @property
-    @merge
     def mapping_types(cls) -> Tuple[Type]:
         """Return all identified relevant standard library mapping types."""
-        return [
-            cls.__builtin_mapping_types,
-        ]
+        return cls.__groups["mapping"]
 
     @property
     def encoding(cls) -> str:
         """Return systems default encoding."""
-        return [
-            cls.__encoding,
-        ]
+        return cls.__encoding
 
 
 class Recurser(metaclass=TypeHandler):
     @classmethod
     def rsnaked(cls, val: Any) -> Any:
         """Recursively change keys to snake case within data structure."""
-        if isinstance(val, cls.binary_types):
+        kind = cls.classify(type(val))
+        if kind == "binary":
             return str(val, cls.encoding)
-        elif isinstance(val, cls.mapping_types):
+        elif kind == "mapping":
             return {cls.snaked(k): cls.rsnaked(v) for k, v in val.items()}
-        elif isinstance(val, cls.iterable_types):
+        elif kind == "iterable":
             return [cls.rsnaked(x) for x in val]
-        elif isinstance(val, cls.constant_types):
+        elif kind == "constant":
             return val
 
     @classmethod
@@ -0,0 +1,151 @@
+import io
+import re
+import pytest
+
+from modules.refactor.chart import Chart
+
+HEADERS = ["name", "count"]
+ROWS = [["alpha", 1], ["b", 12345], ["gamma", 7]]
+
+
+def test_render_to_two_pass():
+    output = io.StringIO()
+    Chart.render_to(output, HEADERS, ROWS, align="left")
+    lines = output.getvalue().splitlines()
+    assert lines[1] == "│ name  │ count │"
+    assert lines[3:6] == [
+        "│ alpha │ 1     │",
+        "│ b     │ 12345 │",
+        "│ gamma │ 7     │",
+    ]
+    assert len(lines) == 7 and len({len(line) for line in lines}) == 1
+
+
+def test_render_to_sample():
+    output = io.StringIO()
+    Chart.render_to(output, HEADERS, iter(ROWS), sample=1)
+    lines = output.getvalue().splitlines()
+    assert lines[3] == "│ alpha │   1   │"
+    assert lines[4] == "│   b   │ 12345 │"
+    assert len(lines) == 7
+
+    # Cells Wider Than the Sampled Widths Overflow Instead of Truncating
+    output = io.StringIO()
+    Chart.render_to(output, HEADERS, iter([["a", 1], ["gamma", 12]]), sample=1)
+    assert output.getvalue().splitlines()[4] == "│ gamma │  12   │"
+    compiled = Chart.compile(HEADERS, [1, 5])
+    assert compiled.render([["gamma", 12]]).splitlines()[3] == "│ g │  12   │"
+
+
+def test_render_to_requires_reiterable():
+    with pytest.raises(TypeError):
+        Chart.render_to(io.StringIO(), HEADERS, iter(ROWS))
+    with pytest.raises(Exception):
+        Chart.render_to(io.StringIO(), HEADERS, [["too", "many", "cells"]])
+
+
+def test_widths_use_widest_cell():
+    lines = Chart(["a"], [[1], [123456], [None]], "left").splitlines()
+    assert lines[3:6] == ["│ 1      │", "│ 123456 │", "│ None   │"]
+
+
+def test_columnar_input():
+    from array import array
+    columns = {"count": array("q", [1, 12345, 7]), "name": ("alpha", "b", "gamma")}
+    assert Chart(HEADERS, columns, "left") == Chart(HEADERS, ROWS, "left")
+
+    output = io.StringIO()
+    Chart.render_to(output, HEADERS, columns, sample=1)
+    assert output.getvalue() == Chart(HEADERS, ROWS) + "\n"
+
+    with pytest.raises(Exception):
+        Chart(HEADERS, {"name": ["a", "b"], "count": [1]})
+
+
+def test_numpy_input():
+    numpy = pytest.importorskip("numpy")
+    table = numpy.array([[1.5, 2], [3, 40]])
+    assert Chart(["x", "y"], table) == Chart(["x", "y"], table.tolist())
+    assert Chart(["x", "y"], {"x": table[:, 0], "y": table[:, 1]}) == Chart(["x", "y"], table)
+
+
+def test_compiled_chart():
+    compiled = Chart.compile(HEADERS, [3, 2], align="left")
+    assert compiled.render(ROWS).splitlines()[1:4] == ["│ nam │ co │", "├─────┼────┤", "│ alp │ 1  │"]
+    assert compiled.render([]) == "\n".join(compiled.render(ROWS).splitlines()[:3] + ["└─────┴────┘"])
+
+    widths = [5, 5]
+    output = io.StringIO()
+    Chart.compile(HEADERS, widths).render_to(output, iter(ROWS))
+    assert output.getvalue() == Chart(HEADERS, ROWS) + "\n"
+    assert Chart.delims is Chart.delims
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_pager(columnar):
+    rows = [[f"row-{i}", i ** 3] for i in range(25)]
+    table = dict(zip(HEADERS, map(list, zip(*rows)))) if columnar else rows
+    pager = Chart.pager(HEADERS, table, page_size=10)
+    full = Chart(HEADERS, rows).splitlines()
+
+    assert len(pager) == 25 and pager.pages == 3
+    assert pager.page(1).splitlines() == full[:3] + full[13:23] + full[-1:]
+    assert pager.page(-1).splitlines() == full[:3] + full[23:28] + full[-1:]
+    assert pager.window(3, 5).splitlines() == full[:3] + full[6:8] + full[-1:]
+    assert pager.widths == [6, 5]
+    with pytest.raises(IndexError):
+        pager.page(3)
+
+
+class Terminal(io.StringIO):
+    """Screen that applies the cursor movements written by LiveChart."""
+    def __init__(self):
+        super().__init__()
+        self.screen, self.row = [""], 0
+
+    def write(self, text):
+        for token in re.findall(r"\x1b\[(\d*)([ABJK])|(\r)|(\n)|([^\x1b\r\n]+)", text):
+            count, code, carriage, newline, chars = token
+            if code == "A":
+                self.row -= int(count)
+            elif code == "B":
+                self.row += int(count)
+            elif code == "J":
+                del self.screen[self.row:]
+                self.screen.append("")
+            elif code == "K" or carriage:
+                pass
+            elif newline:
+                self.row += 1
+                if self.row == len(self.screen):
+                    self.screen.append("")
+            else:
+                self.screen[self.row] = chars
+        return super().write(text)
+
+
+def test_live_chart():
+    live = Chart.live(HEADERS, ROWS)
+    terminal = Terminal()
+    live.refresh(terminal)
+    assert terminal.screen[:-1] == Chart(HEADERS, ROWS).splitlines()
+
+    # Single Changed Row Rewrites One Line
+    live[1] = ["b", 54321]
+    assert live.refresh(terminal) < len(live.render()) // 4
+    assert live.refresh(terminal) == 0
+
+    # Growing, Shrinking and Widening the Table
+    for change in (
+        lambda: live.append(["delta", 2]),
+        lambda: live.insert(0, ["epsilon", 3]),
+        lambda: live.delete(2),
+        lambda: live.delete(-1),
+    ):
+        change()
+        live.refresh(terminal)
+        assert terminal.screen[:-1] == live.render().splitlines()
+        assert terminal.row == len(terminal.screen) - 1
+
+    assert live.widths == [7, 5]
+    assert live[0] == ("epsilon", "3")
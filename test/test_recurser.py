@@ -0,0 +1,212 @@
+import pytest
+from types import SimpleNamespace
+
+from modules.refactor.recurser import Recurser
+
+
+class Leaf:
+    def __init__(self):
+        self.value = b"leaf"
+        self._hidden = 1
+
+    def method(self):
+        return self.value
+
+
+class Branch:
+    def __init__(self):
+        self.leaves = [Leaf(), None]
+        self.size = 2
+
+
+def nested(depth):
+    payload = {"leaf": True}
+    for i in range(depth):
+        payload = {"level": i, "child": [payload]}
+    return payload
+
+
+def test_rdict_builtins():
+    val = {"a": (1, {2}), "b": b"x", "c": range(2), "d": None}
+    assert Recurser.rdict(val) == {"a": [1, [2]], "b": "x", "c": [0, 1], "d": "None"}
+
+
+def test_rdict_nonbuiltins():
+    assert Recurser.rdict(Branch())["leaves"][0].__class__ is Leaf
+    assert Recurser.rdict(Branch(), convert_nonbuiltins=True) == {
+        "leaves": [{"value": "leaf"}, "None"],
+        "size": 2,
+    }
+
+
+def test_rnamespace_nested():
+    result = Recurser.rnamespace(
+        {"a": Branch()}, convert_nonbuiltins=True, nested_namespaces=True
+    )
+    assert result == SimpleNamespace(a=SimpleNamespace(
+        leaves=[SimpleNamespace(value="leaf"), "None"], size=2,
+    ))
+    assert Recurser.rnamespace(Branch(), convert_nonbuiltins=True) == SimpleNamespace(
+        leaves=[{"value": "leaf"}, "None"], size=2,
+    )
+
+
+def test_rsnaked():
+    assert Recurser.rsnaked({"FooBar": [{"aB": object()}]}) == {"foo_bar": [{"a_b": None}]}
+
+
+def test_deep_payloads():
+    depth = 5000
+    result = Recurser.rdict(nested(depth))
+    for _ in range(depth):
+        result = result["child"][0]
+    assert result == {"leaf": True}
+    assert Recurser.rnamespace(nested(depth), nested_namespaces=True).level == depth - 1
+
+
+def test_register_types():
+    from decimal import Decimal
+
+    class Custom(Recurser):
+        pass
+
+    class Money(Decimal):
+        pass
+
+    assert Custom.classify(Decimal) is None
+    assert Custom.rdict({"a": Decimal(1)}) == {"a": "1"}
+
+    Custom.register("constant", Decimal)
+    assert Custom.classify(Money) == "constant"
+    assert Custom.rdict({"a": Money(1)}) == {"a": Money(1)}
+    assert Decimal in Custom.constant_types
+    assert Decimal not in Recurser.constant_types
+    assert Custom.classify(bool) == "constant"
+    assert Custom.classify(bytearray) == "binary"
+
+    # Registering a Type From Another Group Moves It to the New Kind
+    Custom.register("constant", tuple)
+    assert Custom.classify(tuple) == "constant"
+    assert tuple not in Custom.iterable_types and list in Custom.iterable_types
+    assert Custom.rdict({"a": (1, Money(2))}) == {"a": (1, Money(2))}
+    assert Recurser.classify(tuple) == "iterable"
+
+    with pytest.raises(ValueError):
+        Custom.register("unknown", Decimal)
+
+
+@pytest.mark.parametrize(
+    "val, expected",
+    [
+        ("", ""),
+        ("A", "a"),
+        ("fooBar", "foo_bar"),
+        ("SquareFeet", "square_feet"),
+        ("already_snaked", "already_snaked"),
+        ("ABC", "A_B_c"),
+        ("a_B", "a_b"),
+        ("ÉtéBien", "été_bien"),
+    ],
+)
+def test_snaked(val, expected):
+    assert Recurser.snaked(val) == expected
+
+
+def test_rsnaked_many():
+    records = [{"recordId": i, "NestedValue": {"innerKey": b"x"}} for i in range(3)]
+    records.append(["notAMapping"])
+    assert Recurser.rsnaked_many(iter(records)) == [
+        Recurser.rsnaked(record) for record in records
+    ]
+
+
+def test_rnamespace_factory():
+    from modules.recursive_namespace import FrozenNamespace
+
+    result = Recurser.rnamespace(
+        [{"a": {"b": (1, 2)}}],
+        nested_namespaces=True,
+        namespace=FrozenNamespace.from_dict,
+    )
+    assert result == [FrozenNamespace(a=FrozenNamespace(b=(1, 2)))]
+
+
+def test_shared_and_cyclic_objects():
+    shared = {"values": [1, 2]}
+    copied = Recurser.rdict([shared, shared])
+    assert copied[0] == copied[1] and copied[0] is not copied[1]
+    reused = Recurser.rdict([shared, shared], share=True)
+    assert reused[0] is reused[1]
+
+    branch = Branch()
+    branch.parent = branch
+    result = Recurser.rdict(branch, convert_nonbuiltins=True)
+    assert result["parent"] is result
+
+    cyclic = []
+    cyclic.append(cyclic)
+    assert Recurser.rsnaked(cyclic)[0] is not cyclic
+    with pytest.raises(ValueError):
+        Recurser.rnamespace(branch, convert_nonbuiltins=True, nested_namespaces=True)
+
+
+def test_attribute_plans():
+    from dataclasses import dataclass, field
+
+    class Shadowed(Branch):
+        __slots__ = ("slotted",)
+        constant = 5
+
+        def __init__(self):
+            super().__init__()
+            self.slotted = 3
+            self.callback = len
+            self.__dict__["label"] = "instance"
+
+        @property
+        def label(self):
+            return "property"
+
+    @dataclass
+    class Record:
+        x: int = 1
+        y: list = field(default_factory=list)
+
+    for obj in (Shadowed(), Shadowed(), Record(), Leaf()):
+        expected = [
+            (x, getattr(obj, x))
+            for x in dir(obj)
+            if not x.startswith("_") and not callable(getattr(obj, x))
+        ]
+        assert list(Recurser._attributes(obj)) == expected
+
+
+def test_parallel_conversions(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from modules.refactor import recurser
+
+    monkeypatch.setattr(recurser, "PARALLEL_THRESHOLD", 10)
+    records = [{"recordId": i, "rawValue": (b"x", {i})} for i in range(101)]
+
+    assert Recurser.rdict(records, workers=2) == Recurser.rdict(records)
+    assert Recurser.rsnaked(tuple(records), workers=2) == Recurser.rsnaked(records)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert Recurser.rnamespace(records, executor=executor) == Recurser.rnamespace(records)
+        assert Recurser.rdict(records[:5], executor=executor) == Recurser.rdict(records[:5])
+
+
+def test_iter_conversions():
+    items = [{"recordId": i, "Item": Branch(), "raw": b"x"} for i in range(3)]
+
+    def records():
+        yield from items
+
+    assert list(Recurser.iter_rdict(records())) == Recurser.rdict(list(records()))
+    assert list(Recurser.iter_rdict(records(), True)) == Recurser.rdict(list(records()), True)
+    assert list(Recurser.iter_rsnaked(records())) == Recurser.rsnaked(list(records()))
+    assert list(Recurser.iter_rnamespace(records(), True, True)) == Recurser.rnamespace(
+        list(records()), True, True
+    )
+
+    stream = Recurser.iter_rsnaked(iter(lambda: {"fooBar": 1}, None))
+    assert next(stream) == {"foo_bar": 1}
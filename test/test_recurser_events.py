@@ -0,0 +1,66 @@
+import io
+import json
+import pytest
+
+from modules.refactor.recurser import Recurser
+from modules.refactor.recurser import events
+
+DOCUMENT = {
+    "FooBar": [1, -2.5e3, True, None, "x\"yé", {"bazQux": [], "Empty": {}}],
+    "longText": "z" * 100,
+    "Numbers": [1e-5, 0, 12345678901234567890],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 65536])
+def test_json_events_roundtrip(chunk_size):
+    stream = events.json_events(io.StringIO(json.dumps(DOCUMENT)), chunk_size)
+    assert events.build(stream) == DOCUMENT
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4096])
+def test_json_events_long_string(chunk_size):
+    text = 'a\\"\\\\b' * (2 ** 19 if chunk_size == 4096 else 50)
+    document = json.dumps({"long": text, "after": [text[:9], 1]})
+    stream = events.json_events(io.StringIO(document), chunk_size)
+    assert events.build(stream) == json.loads(document)
+    with pytest.raises(ValueError):
+        list(events.json_events(io.StringIO(document[:-20]), chunk_size))
+
+
+@pytest.mark.parametrize("document", ['{"a" 1}', "[1,]", "[1 2]", '{"a":1', "{1:2}", "tru", "[1]]", ""])
+def test_json_events_invalid(document):
+    with pytest.raises(ValueError):
+        list(events.json_events(io.StringIO(document), 2))
+
+
+def test_stream_rsnaked_json():
+    output = io.StringIO()
+    stream = events.json_events(io.StringIO(json.dumps(DOCUMENT)), 5)
+    events.dump_json(Recurser.stream_rsnaked(stream), output)
+    assert json.loads(output.getvalue()) == Recurser.rsnaked(DOCUMENT)
+
+
+def test_stream_yaml():
+    yaml = pytest.importorskip("yaml")
+    document = "Bills: [electric, gas]\nEntities:\n  SquareFeet: 2962\n  Data: !!binary aGk=\n"
+    stream = Recurser.stream_rsnaked(events.yaml_events(document))
+    assert events.build(stream) == Recurser.rsnaked(yaml.safe_load(document))
+    stream = Recurser.stream_rdict(events.yaml_events(document))
+    assert events.build(stream) == Recurser.rdict(yaml.safe_load(document))
+
+
+def test_stream_rdict_keeps_keys():
+    stream = [
+        (events.START_MAPPING, None),
+        (events.SCALAR, None), (events.SCALAR, 1),
+        (events.SCALAR, 2), (events.SCALAR, b"hi"),
+        (events.END_MAPPING, None),
+    ]
+    expected = Recurser.rdict({None: 1, 2: b"hi"})
+    assert events.build(Recurser.stream_rdict(stream)) == expected == {None: 1, 2: "hi"}
+
+    yaml = pytest.importorskip("yaml")
+    document = "~: 1\n2: [x]\n"
+    stream = Recurser.stream_rdict(events.yaml_events(document))
+    assert events.build(stream) == Recurser.rdict(yaml.safe_load(document)) == {None: 1, 2: ["x"]}
@@ -7,7 +7,187 @@ from importlib import import_module
     "import_path",
     [
         "modules.recursive_namespace",
+        "modules.refactor.chart",
+        "modules.refactor.recurser",
+        "modules.refactor.shell_split",
+        "modules.tree_node",
     ],
 )
 def test_imports(import_path):
     import_module(import_path)
+
+
+CONFIG = {"a": {"b": {"c": 1}}, "items": [{"x": 1}, 2], "z": 3}
+
+
+def test_lazy_namespace_access():
+    from modules.recursive_namespace import LazyRecursiveNamespace
+
+    ns = LazyRecursiveNamespace(**CONFIG)
+    assert list(vars(ns)) == ["items"]
+    assert ns.a.b.c == 1
+    assert ns.a is ns.a
+    assert ns.items[0].x == 1
+    assert ns.get("missing", 5) == 5
+    assert list(vars(ns)) == ["items", "a"]
+
+
+def test_lazy_namespace_internal_names():
+    from modules.recursive_namespace import LazyRecursiveNamespace
+
+    ns = LazyRecursiveNamespace(_source=1, _owned=2, wrap="x", a={"b": 1})
+    assert (ns._source, ns._owned, ns.wrap, ns.a.b) == (1, 2, "x", 1)
+
+
+def test_lazy_namespace_matches_eager():
+    import pickle
+    from modules.recursive_namespace import LazyRecursiveNamespace, RecursiveNamespace
+
+    lazy, eager = LazyRecursiveNamespace(**CONFIG), RecursiveNamespace(**CONFIG)
+    assert lazy == eager
+    assert len(lazy) == len(eager)
+    assert [k for k, _ in lazy] == [k for k, _ in eager]
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+
+
+def test_lazy_namespace_mutation():
+    from modules.recursive_namespace import LazyRecursiveNamespace
+
+    ns = LazyRecursiveNamespace(**CONFIG)
+    del ns.a.b
+    ns["z"] = 4
+    assert CONFIG["a"] == {"b": {"c": 1}}
+    assert ns.a.get("b") is None
+    assert [k for k, _ in ns] == ["a", "items", "z"] and ns.z == 4
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_namespace_mapping_views(lazy):
+    from modules.recursive_namespace import LazyRecursiveNamespace, RecursiveNamespace
+
+    ns = (RecursiveNamespace, LazyRecursiveNamespace)[lazy](a=1, b={"c": 2})
+    assert len(ns) == 2
+    assert "a" in ns and "missing" not in ns
+    assert list(ns.keys()) == ["a", "b"]
+    assert list(ns.values())[0] == 1
+    assert list(ns.items())[1][1].c == 2
+    assert list(ns) == list(ns.items())
+
+    ns["d"] = 3
+    assert len(ns) == 3 and "d" in ns.keys()
+
+
+def test_traverse():
+    from modules.recursive_namespace import RecursiveNamespace
+
+    ns = RecursiveNamespace(a={"b": {"c": 1}, "d": 2}, e=[{"f": 3}], g={"h": 4})
+    assert [k for k, _ in ns.traverse()] == ["a", "b", "c", "d", "e", "g", "h"]
+    assert [k for k, _ in ns.traverse(breadth_first=True)] == ["a", "e", "g", "b", "d", "h", "c"]
+    assert [k for k, _ in ns.traverse(paths=True, lists=True)] == [
+        "a", "a.b", "a.b.c", "a.d", "e", "e[0]", "e[0].f", "g", "g.h",
+    ]
+    assert list(ns.traverse(paths=True, until=lambda k, v: v == 1))[-1] == ("a.b.c", 1)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_path_lookups(lazy):
+    from modules.recursive_namespace import (
+        LazyRecursiveNamespace,
+        RecursiveNamespace,
+        compile_path,
+    )
+
+    ns = (RecursiveNamespace, LazyRecursiveNamespace)[lazy](
+        entities={"above": {"sqft": 1, "tags": [{"n": 1}, {"n": 2}]}, "below": {"sqft": 2}},
+    )
+    assert compile_path("entities.above.tags[1].n")(ns) == 2
+    assert ns.lookup("entities.above.sqft") == 1
+    assert ns.lookup("entities.*.sqft") == [1, 2]
+    assert ns.lookup("entities.*.tags[*].n") == [1, 2]
+
+    ns.entities.above["sqft"] = 3
+    assert ns.lookup("entities.above.sqft") == 3
+    ns.entities.above.tags[1] = RecursiveNamespace(n=99)
+    assert ns.lookup("entities.above.tags[1].n") == 99
+    del ns.entities["below"]
+    assert ns.lookup("entities.below", "missing") == "missing"
+
+    # Wildcards Only Expand Namespaces (*) and Lists ([*])
+    ns = (RecursiveNamespace, LazyRecursiveNamespace)[lazy](
+        a={"x": "hi", "y": {"k": 1}, "z": 5, "l": [{"k": 2}, 3]},
+    )
+    assert ns.lookup("a.*.*") == [1]
+    assert ns.lookup("a.*[*].k") == [2]
+    assert ns.lookup("a[*]") == []
+    cls = (RecursiveNamespace, LazyRecursiveNamespace)[lazy]
+    assert cls(values={"x": 1}, a={"y": 2}).lookup("*.y") == [2]
+
+    with pytest.raises(ValueError):
+        compile_path("entities..above")
+
+
+def test_frozen_namespace():
+    import pickle
+    from modules.recursive_namespace import FrozenNamespace
+
+    ns = FrozenNamespace(a=1, b={"c": [1, {"d": 2}]}, **{"e-f": 3})
+    assert ns.a == 1 and ns.b.c[1].d == 2 and ns["e-f"] == 3
+    assert ns.get("missing", 4) == 4 and "a" in ns and len(ns) == 3
+    assert dict(ns.items()) == dict(ns) and list(ns.keys()) == ["a", "b", "e-f"]
+    assert type(ns) is type(FrozenNamespace.from_dict({"a": 0, "b": 0, "e-f": 0}))
+
+    same = FrozenNamespace.from_dict({"a": 1, "b": {"c": [1, {"d": 2}]}, "e-f": 3})
+    assert ns == same and hash(ns) == hash(same)
+    assert FrozenNamespace(a=1) != FrozenNamespace(b=1) and FrozenNamespace(a=1) != (1,)
+    assert pickle.loads(pickle.dumps(ns)) == ns
+
+    with pytest.raises(AttributeError):
+        ns.a = 2
+    with pytest.raises(AttributeError):
+        ns["missing"]
+
+
+def test_frozen_namespace_schema_limit(monkeypatch):
+    import pickle
+    import modules.recursive_namespace as module
+    from modules.recursive_namespace import FrozenNamespace
+
+    monkeypatch.setattr(module, "SCHEMA_CACHE_SIZE", len(module._SCHEMAS))
+    cached = len(module._SCHEMAS)
+    records = [FrozenNamespace.from_dict({f"id{i}": i, "x": {"y": i}}) for i in range(50)]
+    assert len(module._SCHEMAS) == cached
+
+    ns = records[7]
+    assert ns.id7 == 7 and ns.x.y == 7 and ns["x"].y == 7 and len(ns) == 2
+    assert ns.get("missing", 4) == 4 and "id7" in ns and list(ns.keys()) == ["id7", "x"]
+    assert dict(ns.items()) == {"id7": 7, "x": ns.x} and list(ns.values())[0] == 7
+    assert ns == FrozenNamespace(id7=7, x={"y": 7}) and ns != records[8]
+    assert hash(ns) == hash(FrozenNamespace(id7=7, x={"y": 7}))
+    assert pickle.loads(pickle.dumps(ns)) == ns
+    with pytest.raises(AttributeError):
+        ns.missing
+    with pytest.raises(AttributeError):
+        ns.id7 = 1
+
+
+def test_frozen_namespace_method_named_keys(monkeypatch):
+    import pickle
+    from modules.refactor import recurser
+    from modules.refactor.recurser import Recurser
+    from modules.recursive_namespace import FrozenNamespace
+
+    ns = FrozenNamespace(keys=1, values=2, items={"get": 3}, a=4)
+    assert ns.keys == 1 and ns.values == 2 and ns.items.get == 3
+    assert pickle.loads(pickle.dumps(ns)) == ns
+    assert FrozenNamespace.values(ns) == (1, 2, ns.items, 4)
+
+    # Results Are Pickled Back From Worker Processes
+    monkeypatch.setattr(recurser, "PARALLEL_THRESHOLD", 2)
+    records = [{"values": i, "keys": [i]} for i in range(3)]
+    result = Recurser.rnamespace(
+        records,
+        nested_namespaces=True,
+        namespace=FrozenNamespace.from_dict,
+        workers=2,
+    )
+    assert [x.values for x in result] == [0, 1, 2]
@@ -0,0 +1,62 @@
+import io
+import pytest
+
+from modules.refactor.shell_split import iter_shell_split, shell_split, shell_split_many, shell_split_spans
+
+
+@pytest.mark.parametrize("string, options, expected", [
+    ("", {}, []),
+    ("  ls  -la\t/tmp \n", {}, ["ls", "-la", "/tmp"]),
+    ("echo \"hello world\" 'it''s' \"\"", {}, ["echo", "hello world", "it", "s", ""]),
+    ("run {a b} [c d] (e f)", {}, ["run", "{a", "b}", "[c", "d]", "(e", "f)"]),
+    ("run {a b} [c d] (e f)", {"braces": True, "brackets": True, "parentheses": True},
+     ["run", "a b", "c d", "e f"]),
+    ("key=\"v 1\"tail", {}, ["v 1", "tail"]),
+    ("{a{b}c}", {"braces": True}, ["a{b", "c}"]),
+    ("echo \"unclosed text", {}, ["echo", "\"unclosed text"]),
+    ("a　b\x1cc", {}, ["a", "b", "c"]),
+])
+def test_shell_split(string, options, expected):
+    assert shell_split(string, **options) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 65536])
+def test_iter_shell_split(chunk_size):
+    text = "run \"a\nb\" {job: [1, 2]}\n\nls -la 'unclosed\nrest"
+    stream = io.StringIO(text)
+    tokens = list(iter_shell_split(stream, braces=True, chunk_size=chunk_size))
+    assert tokens == shell_split(text, braces=True)
+
+    lines = list(iter_shell_split(io.StringIO(text), braces=True, lines=True, chunk_size=chunk_size))
+    assert lines == [["run", "a\nb", "job: [1, 2]"], [], ["ls", "-la", "'unclosed\nrest"]]
+    assert list(iter_shell_split(text.splitlines(True), braces=True, lines=True)) == lines
+
+
+@pytest.mark.parametrize("convert", [str, str.encode, lambda text: memoryview(text.encode())])
+def test_shell_split_spans(convert):
+    text = "echo \"a b\" x{c}  [d] 'open"
+    spans = shell_split_spans(convert(text), braces=True)
+    assert spans.typecode == "q"
+    triples = list(zip(*[iter(spans)] * 3))
+    assert [text[start:end] for start, end, _ in triples] == shell_split(text, braces=True)
+    assert [opener for _, _, opener in triples] == [0, ord("\""), ord("{"), 0, 0]
+
+
+@pytest.mark.parametrize("convert", [str, str.encode, lambda text: memoryview(text.encode())])
+def test_shell_split_spans_trailing_whitespace(convert):
+    for text in ["a" + " " * 100000, "a {b" + "\n" * 100000, " \t" * 100000]:
+        spans = shell_split_spans(convert(text), braces=True)
+        triples = list(zip(*[iter(spans)] * 3))
+        assert [text[start:end] for start, end, _ in triples] == shell_split(text, braces=True)
+
+
+def test_shell_split_many():
+    from concurrent.futures import ThreadPoolExecutor
+
+    lines = ["ls -la", "echo 'a b'", "", "run {x y}"] * 5
+    expected = [shell_split(line, braces=True) for line in lines]
+    assert shell_split_many(iter(lines), braces=True) == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert shell_split_many(lines, braces=True, chunksize=3, executor=executor) == expected
+    assert shell_split_many(lines, braces=True, workers=2) == expected
+    assert shell_split_many(lines, braces=True, workers=0) == expected
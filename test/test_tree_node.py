@@ -0,0 +1,125 @@
+import io
+import pytest
+
+from modules.tree_node import Node
+
+
+def tree() -> Node:
+    """Build root -> (a -> (a1, a2), b -> (b1))."""
+    root = Node("root")
+    for name, leaves in (("a", ["a1", "a2"]), ("b", ["b1"])):
+        child = Node(name)
+        root.add_child(child)
+        for leaf in leaves:
+            child.add_child(leaf)
+    return root
+
+
+EXPECTED = """└─ root
+   ├─ a
+   │  ├─ a1
+   │  └─ a2
+   └─ b
+      └─ b1"""
+
+
+def test_display():
+    root = tree()
+    assert root.display() == EXPECTED
+    assert root.display() == EXPECTED
+    assert root.children[1].display() == "└─ b\n   └─ b1"
+    assert root.children[1].display(from_root=True) == EXPECTED
+
+    output = io.StringIO()
+    root.display_to(output)
+    assert output.getvalue() == EXPECTED + "\n"
+
+
+def test_display_limits():
+    root = tree()
+    assert root.display(max_depth=1) == "└─ root\n   ├─ a\n   └─ b"
+    assert root.display(max_depth=0) == "└─ root"
+    assert list(root.display_lines(max_nodes=3)) == EXPECTED.splitlines()[:3]
+    assert root.display(max_nodes=0) == ""
+
+
+def test_display_deep_tree():
+    root = current = Node(0)
+    for i in range(1, 5000):
+        current.add_child(i)
+        current = current.children[0]
+    lines = root.display().splitlines()
+    assert len(lines) == 5000
+    assert lines[-1] == " " * 3 * 4999 + "└─ 4999"
+
+
+@pytest.mark.parametrize("order, expected", [
+    ("pre", ["root", "a", "a1", "a2", "b", "b1"]),
+    ("post", ["a1", "a2", "a", "b1", "b", "root"]),
+    ("level", ["root", "a", "b", "a1", "a2", "b1"]),
+    ("leaves", ["a1", "a2", "b1"]),
+])
+def test_traverse(order, expected):
+    root = tree()
+    assert [node.data for node in root.traverse(order)] == expected
+
+    depths = {"root": 0, "a": 1, "b": 1}
+    assert [(depth, node.data) for depth, node in root.traverse(order, depths=True)] == [
+        (depths.get(name, 2), name) for name in expected
+    ]
+
+    skipped = [node.data for node in root.traverse(order, skip=lambda node: node.data == "a")]
+    assert skipped == [name for name in expected if not name.startswith("a")]
+
+    stopped = [node.data for node in root.traverse(order, until=lambda node: node.data == "a2")]
+    assert stopped == expected[:expected.index("a2") + 1]
+
+
+def test_traverse_deep_tree():
+    root = current = Node(0)
+    for i in range(1, 100000):
+        current.add_child(i)
+        current = current.children[0]
+    assert [node.data for node in root] == list(range(100000))
+    assert next(root.traverse("post")).data == 99999
+    with pytest.raises(ValueError):
+        list(root.traverse("inorder"))
+
+
+def test_depth_and_root_maintained():
+    root = tree()
+    subtree = Node("c")
+    subtree.add_child("c1")
+    leaf = subtree.children[0]
+    assert (leaf.depth, leaf.root) == (1, subtree)
+
+    root.children[1].children[0].add_child(subtree)
+    assert (subtree.depth, leaf.depth, leaf.root) == (3, 4, root)
+
+    # Moving a Node Detaches it From its Previous Parent
+    root.add_child(subtree)
+    assert subtree not in root.children[1].children[0].children
+    assert (subtree.parent, leaf.depth) == (root, 2)
+
+    with pytest.raises(ValueError):
+        leaf.add_child(root)
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_ancestor_queries(indexed):
+    root = tree()
+    a, b = root.children
+    a1, a2 = a.children
+    b1 = b.children[0]
+    if indexed:
+        assert root.build_index() is a1.build_index()
+
+    assert root.is_ancestor(a2) and a.is_ancestor(a1)
+    assert not a.is_ancestor(b1) and not a1.is_ancestor(a) and not a.is_ancestor(a)
+    assert [a2.kth_ancestor(k) for k in range(4)] == [a2, a, root, None]
+    assert (a1.lca(a2), a1.lca(b1), a.lca(a2), b1.lca(b1)) == (a, root, a, b1)
+    assert a1.lca(Node("other")) is None
+
+    # Changes Drop the Index and Queries Still Answer
+    a1.add_child("a11")
+    assert a1.children[0].kth_ancestor(2) is a and a1.children[0].lca(a2) is a